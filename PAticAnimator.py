@@ -2,18 +2,409 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.path as mpath
 import matplotlib.markers as mmarkers
-import matplotlib.gridspec as mgs
 import matplotlib.patches as mpatches
 
 from matplotlib.transforms import Affine2D
 from matplotlib.cm import ScalarMappable
 
 import os
-import shutil
+import copy
+import collections
+import concurrent.futures
+import multiprocessing.shared_memory
 import imageio
-import imageio.v3 as iio
 
 import datetime
+import functools
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+@functools.lru_cache(maxsize=8)
+def _default_grid(nx,ny):
+    '''
+    Constructs the 1D coordinate vectors of the default grid on the unit square [0,1]x[0,1] with
+    nx and ny points along the respective axes. The vectors are cached by shape, so that resetting
+    the phase field with an array of the same shape doesn't rebuild them. Because the cached
+    vectors are shared between animator objects, they are returned read-only.
+
+    Called in:
+        - PAticAnimator._set_default_grid
+    '''
+    x1d = np.linspace(0,1,nx)
+    y1d = np.linspace(0,1,ny)
+    x1d.flags.writeable = False
+    y1d.flags.writeable = False
+
+    return x1d,y1d
+
+@functools.lru_cache(maxsize=8)
+def _pi_tick_labels(d):
+    '''
+    Constructs the LaTeX labels of the 9 colorbar ticks placed uniformly on [-4pi/d,4pi/d], with
+    the fractions reduced. The labels depend only on d, so they are cached by it and returned as a
+    tuple.
+
+    Called in:
+        - PAticAnimator._initialize_plot
+    '''
+    tick_labels = []
+    for m in range(9):
+        n = np.abs(4-m)
+
+        nr = n/np.gcd(n,d)
+        dr = d/np.gcd(n,d)
+
+        if m < 4:
+            if nr == 1 and dr == 1:
+                label = r'$-\pi$'
+            elif nr == 1:
+                label = r'$-\frac{\pi}{%d}$' % dr
+            elif dr == 1:
+                label = r'$-%d\pi$' % nr
+            else:
+                label = r'$-\frac{%d\pi}{%d}$' % (nr,dr)
+        elif m == 4:
+            label = r'$0$'
+        else:
+            if nr == 1 and dr == 1:
+                label = r'$\pi$'
+            elif nr == 1:
+                label = r'$\frac{\pi}{%d}$' % dr
+            elif dr == 1:
+                label = r'$%d\pi$' % nr
+            else:
+                label = r'$\frac{%d\pi}{%d}$' % (nr,dr)
+        tick_labels.append(label)
+
+    return tuple(tick_labels)
+
+def _gather_marker_values(a,idx,out):
+    '''
+    Gathers the values of the flattened array a at the flat indices idx into out. The indices are
+    always in bounds, so the gather uses mode='clip', with which np.take writes straight into out
+    instead of buffering the result first. If numba is available, this function is replaced by a
+    compiled loop.
+
+    Called in:
+        - PAticAnimator._marker_values
+        - PAticAnimator._marker_vectors
+    '''
+    return np.take(a,idx,out=out,mode='clip')
+
+def _rotate_vertices(angles,vertices):
+    '''
+    Rotates the vertices of a marker path by every one of the given angles. Returns an array of
+    shape (angles.size,vertices.shape[0],2) holding the rotated vertices of one marker per angle.
+    The rotation matrices of all angles are stacked, so that the rotation is a single broadcast
+    matmul. If numba is available, this function is replaced by a compiled version that splits the
+    markers among the available threads.
+
+    Called in:
+        - PAticAnimator._rotated_paths
+    '''
+    angles = angles.astype(np.float64)
+    c = np.cos(angles)
+    s = np.sin(angles)
+    rot = np.stack([np.stack([c,s],-1),np.stack([-s,c],-1)],-2)
+
+    return vertices[np.newaxis,:,:] @ rot
+
+def _decompose_complex(field,magnitude):
+    '''
+    Computes the phase (and, if magnitude is True, the magnitude) of the C-contiguous complex
+    array field. Returns the phase, the magnitude (None if it isn't computed) and an array with
+    the minimum and maximum of the phase followed by those of the magnitude, skipping NaN entries
+    of the field. If numba is available, this function is replaced by a compiled version that
+    computes all of them in a single pass over the field. The pass only runs when the field is set,
+    so it is kept serial rather than starting numba's thread pool.
+
+    Called in:
+        - PAticAnimator._decompose_field
+    '''
+    thetas = np.empty(field.shape,dtype=field.real.dtype)
+    np.arctan2(field.imag,field.real,out=thetas)
+    if magnitude:
+        rs = np.abs(field)
+        extrema = np.array([np.nanmin(thetas),np.nanmax(thetas),np.nanmin(rs),np.nanmax(rs)])
+    else:
+        rs = None
+        extrema = np.array([np.nanmin(thetas),np.nanmax(thetas),0,0],dtype=thetas.dtype)
+
+    return thetas,rs,extrema
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _gather_marker_values(a,idx,out):
+        for m in range(idx.size):
+            out[m] = a[idx[m]]
+
+        return out
+
+    @numba.njit(parallel=True,fastmath=True,cache=True)
+    def _rotate_vertices(angles,vertices):
+        out = np.empty((angles.size,vertices.shape[0],2))
+        for m in numba.prange(angles.size):
+            c = np.cos(np.float64(angles[m]))
+            s = np.sin(np.float64(angles[m]))
+            for v in range(vertices.shape[0]):
+                out[m,v,0] = c*vertices[v,0] - s*vertices[v,1]
+                out[m,v,1] = s*vertices[v,0] + c*vertices[v,1]
+
+        return out
+
+    @numba.njit(cache=True)
+    def _decompose_complex_kernel(field,magnitude):
+        n = field.size
+        f = field.reshape(n)
+        thetas = np.empty(field.shape,dtype=f.real.dtype)
+        rs = np.empty(field.shape if magnitude else (0,0,0),dtype=f.real.dtype)
+        thetas_flat = thetas.reshape(n)
+        rs_flat = rs.reshape(rs.size)
+
+        tmin = np.inf
+        tmax = -np.inf
+        rmin = np.inf
+        rmax = -np.inf
+        for k in range(n):
+            t = np.arctan2(f[k].imag,f[k].real)
+            thetas_flat[k] = t
+            if t == t:
+                tmin = min(tmin,t)
+                tmax = max(tmax,t)
+            if magnitude:
+                r = abs(f[k])
+                rs_flat[k] = r
+                if r == r:
+                    rmin = min(rmin,r)
+                    rmax = max(rmax,r)
+
+        extrema = np.zeros(4,dtype=f.real.dtype)
+        extrema[0] = tmin if tmin <= tmax else np.nan
+        extrema[1] = tmax if tmin <= tmax else np.nan
+        if magnitude:
+            extrema[2] = rmin if rmin <= rmax else np.nan
+            extrema[3] = rmax if rmin <= rmax else np.nan
+
+        return thetas,rs,extrema
+
+    def _decompose_complex(field,magnitude):
+        thetas,rs,extrema = _decompose_complex_kernel(field,magnitude)
+        return thetas,(rs if magnitude else None),extrema
+
+_worker = None
+
+def _share_arrays(animator):
+    '''
+    Copies the phase field based arrays of the given animator object into shared memory blocks, so
+    that the worker processes can read them without every one of them receiving a pickled copy.
+    Returns a shallow copy of the animator without these arrays, a dictionary with the name, shape
+    and dtype of the shared memory block for every array, and the blocks themselves, which the
+    caller has to close and unlink once the workers are done.
+
+    Called in:
+        - PAticAnimator.animate
+    '''
+    light = copy.copy(animator)
+    specs = {}
+    blocks = []
+    for name in animator._shared_slots:
+        a = getattr(animator,name,None)
+        if isinstance(a,np.ndarray):
+            shm = multiprocessing.shared_memory.SharedMemory(create=True,size=max(a.nbytes,1))
+            blocks.append(shm)
+            np.ndarray(a.shape,dtype=a.dtype,buffer=shm.buf)[...] = a
+            specs[name] = (shm.name,a.shape,a.dtype.str)
+            setattr(light,name,None)
+
+    return light,specs,blocks
+
+def _init_render_worker(animator,specs):
+    '''
+    Sets up a render worker process. The pyplot backend is switched to Agg, so that the figures
+    built in the worker are never attached to a GUI, the shared arrays are attached to the given
+    animator object as views of the shared memory blocks, and the plot is initialized once for all
+    of the frames that the worker renders.
+
+    Called in:
+        - PAticAnimator.animate
+
+    Calls on:
+        - _start_blit
+        - _frame_blitter
+    '''
+    global _worker
+
+    plt.switch_backend('Agg')
+
+    blocks = []
+    for name,(shm_name,shape,dtype) in specs.items():
+        shm = multiprocessing.shared_memory.SharedMemory(name=shm_name)
+        blocks.append(shm)
+        setattr(animator,name,np.ndarray(shape,dtype=dtype,buffer=shm.buf))
+
+    _worker = (_frame_blitter(animator,*_start_blit(animator)),blocks)
+
+def _start_blit(animator):
+    '''
+    Initializes the plot of the given animator object for blitting: the static part of the
+    figure is rendered once, while the artists that change from frame to frame are marked as
+    animated. Returns the animated artists and the rendered background.
+
+    Called in:
+        - _init_render_worker
+        - _iter_frames
+
+    Calls on:
+        - PAticAnimator._initialize_plot
+        - PAticAnimator._blit_artists
+    '''
+    animator._initialize_plot()
+
+    canvas = animator.fig.canvas
+    artists = animator._blit_artists()
+    for artist in artists:
+        artist.set_animated(True)
+    canvas.draw()
+
+    return artists,canvas.copy_from_bbox(animator.fig.bbox)
+
+def _frame_blitter(animator,artists,background):
+    '''
+    Returns a function that draws frame i of the animation of the given animator object on top of
+    the background from _start_blit and returns the RGBA pixel buffer of the canvas. Everything the
+    function needs for a frame is bound once here, so that no attribute has to be looked up again
+    in the frame loop. The returned array is a view of the canvas, so it is only valid until the
+    next frame is drawn.
+
+    Called in:
+        - _init_render_worker
+        - _iter_frames
+
+    Calls on:
+        - PAticAnimator._draw_frame
+    '''
+    canvas = animator.fig.canvas
+    draw_frame = animator._draw_frame
+    restore_region = canvas.restore_region
+    buffer_rgba = canvas.buffer_rgba
+    asarray = np.asarray
+
+    def blit(i):
+        draw_frame(i)
+        restore_region(background)
+        for artist in artists:
+            if artist.axes is not None:
+                artist.axes.draw_artist(artist)
+
+        return asarray(buffer_rgba())
+
+    return blit
+
+def _iter_frames(animator,frames):
+    '''
+    Initializes the plot of the given animator object and renders the given frames of the
+    animation one after the other, yielding the RGBA pixel buffer of the canvas for every frame.
+    The frames are blitted: the static part of the figure is rendered once and restored for every
+    frame, on top of which only the artists that change from frame to frame are drawn.
+
+    Called in:
+        - PAticAnimator.animate
+
+    Calls on:
+        - _start_blit
+        - _frame_blitter
+    '''
+    artists,background = _start_blit(animator)
+    blit = _frame_blitter(animator,artists,background)
+    try:
+        for i in frames:
+            yield blit(i)
+    finally:
+        for artist in artists:
+            artist.set_animated(False)
+
+def _render_frames(frames):
+    '''
+    Renders the given frames of the animation in a worker process set up by _init_render_worker
+    and returns them as a uint8 array of shape (len(frames),height,width,4).
+
+    Called in:
+        - _iter_rendered_frames
+
+    Calls on:
+        - None
+    '''
+    blit,blocks = _worker
+
+    out = None
+    for k,i in enumerate(frames):
+        frame = blit(i)
+        if out is None:
+            out = np.empty((len(frames),) + frame.shape,dtype=frame.dtype)
+        out[k] = frame
+
+    return out
+
+def _iter_rendered_frames(executor,chunks,window):
+    '''
+    Renders the given chunks of frames with the worker processes of executor and yields the frames
+    in order. At most window chunks are submitted ahead of the one being yielded, and the next chunk
+    is only submitted once a finished one has been taken, so the rendered frames waiting for the
+    encoder never pile up in the calling process, no matter how many frames there are.
+
+    Called in:
+        - PAticAnimator.animate
+
+    Calls on:
+        - _render_frames
+    '''
+    chunks = iter(chunks)
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(executor.submit(_render_frames,chunk))
+        if len(pending) == window:
+            break
+
+    while pending:
+        frames = pending.popleft().result()
+        chunk = next(chunks,None)
+        if chunk is not None:
+            pending.append(executor.submit(_render_frames,chunk))
+        yield from frames
+
+def _write_frames(file_name,frames,ext):
+    '''
+    Encodes the RGBA frames from the iterable frames into the video file file_name of type ext
+    with ffmpeg. Every frame is handed to the encoder as soon as it is available, so the frames
+    never have to be kept in memory or written to disk all at once. GIFs are encoded with the gif
+    codec, each frame with its own generated palette, since the container can't hold the default
+    H.264 stream. GIFs are encoded at the size of the canvas. MP4 frames are only padded to even
+    dimensions, which the yuv420p output of H.264 requires, rather than to a multiple of 16.
+
+    Called in:
+        - PAticAnimator.animate
+
+    Calls on:
+        - None
+    '''
+    if ext == 'gif':
+        kwargs = {"codec":"gif","pix_fmt_out":"pal8","macro_block_size":1,
+                  "output_params":["-filter_complex","split[s0][s1];[s0]palettegen=stats_mode=single[p];[s1][p]paletteuse=new=1"]}
+    else:
+        kwargs = {"macro_block_size":2}
+
+    gen = None
+    for frame in frames:
+        if gen is None:
+            gen = imageio.plugins.ffmpeg.imageio_ffmpeg.write_frames(file_name,(frame.shape[1],frame.shape[0]),fps=60,pix_fmt_in='rgba',ffmpeg_log_level='error',**kwargs)
+            gen.send(None)
+        gen.send(frame)
+
+    if gen is not None:
+        gen.close()
 
 class PAticAnimator(object):
     '''
@@ -85,7 +476,8 @@ class PAticAnimator(object):
             field array.
 
         x: 2D array || (default: None)
-           x-coordinate grid. Defaults to None until the coordinate grid is fully constructed as
+           x-coordinate grid, stored sparse with shape (1,nx) so that it broadcasts against the
+           y-coordinate grid. Defaults to None until the coordinate grid is fully constructed as
            described above (see also the set_grid class method).
 
         y0: float || (default: None)
@@ -103,12 +495,17 @@ class PAticAnimator(object):
             shape of the phase field array.
 
         y: 2D array || (default: None)
-           y-coordinate grid. Defaults to None until the coordinate grid is fully constructed as
+           y-coordinate grid, stored sparse with shape (ny,1) so that it broadcasts against the
+           x-coordinate grid. Defaults to None until the coordinate grid is fully constructed as
            described above (see also the set_grid class method).
 
         field: 3D array || (default: None)
             Phase field array.
 
+        complex_field: bool || (default: False)
+            Whether the phase field array holds complex values (of any precision). Determined from
+            the dtype of the phase field array whenever it is set.
+
         which: str || 'pf' | 'op' | 'both' | (default: 'pf')
             Determines which of the phase field and order parameter to plot.
               'pf' - phase field,
@@ -133,13 +530,18 @@ class PAticAnimator(object):
             2 - plots the order parameter with markers color mapped by the appropriate value of the
                 phase field over a semi-transparent phase field contour plot.
 
-        fig: Matplotlib figure
+        fig: Matplotlib figure || (default: None)
             The figure where the plot is drawn. This attribute can be manipulated just like a
             regular matplotlib.figure object.
 
-        ax1: Matplotlib axes
-            The main axes of the figure. This attribute will always contain a matplotlib.axes
-            instance, regardless of how the plot (which, grouping, mode attributes) is set up.
+            The figure is only created once it is needed, i.e. on the first call to preview,
+            saveframe or animate, so that setting up the animator doesn't pay for starting up the
+            Matplotlib backend. Until then, fig, ax1 and ax2 are all None.
+
+        ax1: Matplotlib axes || (default: None)
+            The main axes of the figure. Once the figure has been created, this attribute will
+            always contain a matplotlib.axes instance, regardless of how the plot (which,
+            grouping, mode attributes) is set up.
 
         ax2: Matplotlib axes || (default: None)
             This attribute will only contain a matplotlib.axes instance when plotting the phase
@@ -418,20 +820,53 @@ class PAticAnimator(object):
                     Determines which frame of the animation to preview. If frame > nt, it will simply
                     be set to nt-1.
 
-        animate(ext='gif')
+        animate(ext='gif',workers=1)
             Makes the animation of the phase field/ order parameter time evolution and saves it to the
             same location as the script from which the method is called.
 
             Keyword arguments:
                 ext: str || 'gif' | 'mp4 | (default: 'gif')
                     Sets the output file type for the animation.
+
+                workers: int, None || (default: 1)
+                    Number of processes among which the frames are rendered. By default the frames
+                    are rendered in the calling process. If workers is None, it will be set to the
+                    number of CPUs. When more than one worker is used on platforms on which the
+                    worker processes are spawned (e.g. Windows and macOS), the calling script must
+                    guard its entry point with if __name__ == '__main__'.
     '''
 
     _field_types = ("complex","magnitude","phase")
     _marker_types = ("patch","point","tick","patch & point","patch & tick","point & tick","all")
+    _marker_subtypes = ("patch","point","tick")
     _which_list = ("pf","op","both")
     _grouping_list = ("separate","together")
     _mode_list = (0,1,2)
+    _marker_type_set = frozenset(_marker_types)
+    _which_set = frozenset(_which_list)
+    _grouping_set = frozenset(_grouping_list)
+    _marker_type_msg = ("""The possible marker types are """ + "'%s', "*(len(_marker_types)-1) + "and '%s'.") % _marker_types
+    _which_msg = ("""which must be one of """ + "'%s', "*(len(_which_list)-1) + "and '%s'.") % _which_list
+    _grouping_msg = ("""grouping must be one of """ + "'%s', "*(len(_grouping_list)-1) + "and '%s'.") % _grouping_list
+    _mode_msg = ("""The allowed values for the mode keyword argument are """ + "%s, "*(len(_mode_list)-1) + "and %s.") % _mode_list
+    _marker_sizes_polygon = (140,100,60,30,20)
+    _marker_sizes_line = (140,140,60,45,30)
+    _marker_linewidths_line = (1.75,1.0,0.85,0.85,0.85)
+
+    __slots__ = ("p","field_type","director","timestamp","ts",
+                 "which","grouping","mode",
+                 "_markers","_marker_paths","marker_type","marker_size","marker_colors","marker_linewidths","marker_transparencies",
+                 "pf_transparency","colormap","ax_fc","CB_label_fontsize","CB_tick_fontsize",
+                 "ts_fontsize","ts_color","ts_bbox_facecolor","ts_bbox_alpha","ts_text",
+                 "fig","ax1","ax2","_axes_dirty","SM","CB","cont","arrow","patch","point","tick","RGBA","_lut","_cbuf","_ibuf","_nbuf",
+                 "marker_density_x","marker_density_y","_slc_x","_slc_y",
+                 "_x_markers","_y_markers","_xs","_ys","_marker_idx_y","_marker_idx_x","_marker_idx","_mbuf","_rbuf","_ubuf","_vbuf",
+                 "field","_field_min","_field_max","complex_field","thetas","_thetas_min","_thetas_max","rs","_rs_min","_rs_max","rs_norm","nt",
+                 "x0","x1","nx","x","_x1d",
+                 "y0","y1","ny","y","_y1d")
+
+    _shared_slots = ("field","thetas","rs","rs_norm")
+    _figure_slots = ("fig","ax1","ax2","_axes_dirty","SM","CB","cont","arrow","patch","point","tick","RGBA","_lut","_cbuf","_ibuf","_nbuf","ts_text")
 
     def __init__(self,p,field=None,x=None,y=None,ts=None,field_type='complex',director=False,timestamp=False):
         '''
@@ -472,17 +907,18 @@ class PAticAnimator(object):
         '''
         if not isinstance(p,int):
             raise TypeError("""p must be an integer.""")
-        elif isinstance(p,int) and p < 1:
+        elif p < 1:
             raise ValueError("""p must be greater than or qual to 1.""")
         else:
             self.p = p
 
-        if field_type is not None and field_type.lower() not in self._field_types:
+        if field_type is not None:
+            field_type = field_type.lower()
+
+        if field_type is not None and field_type not in self._field_types:
             raise ValueError("""The field_type keyword argument must be one of 'complex', 'magnitude' or 'phase'.""")
-        elif field_type is not None:
-            self.field_type = field_type.lower()
         else:
-            self.field_type = None
+            self.field_type = field_type
 
         if not isinstance(director,bool):
             raise TypeError("""The director keyword argument must be a boolean.""")
@@ -498,6 +934,8 @@ class PAticAnimator(object):
         self.mode = 0
 
         self._markers = {"patch":(p,0,-90), "point":(p,2,-90), "tick":(1,2,-90)}
+        base_rot = Affine2D().rotate_deg(-90).frozen()
+        self._marker_paths = {name:mmarkers.MarkerStyle(spec).get_path().transformed(base_rot) for name,spec in self._markers.items()}
         self.marker_type = "all"
         self.marker_size = 500
         self.marker_colors = {"patch":'k', "point":'k', "tick":'r'}
@@ -515,9 +953,10 @@ class PAticAnimator(object):
         self.ts_bbox_facecolor = 'k'
         self.ts_bbox_alpha = 0.5
 
-        self.fig = plt.figure(figsize=(12.0,10.0),frameon=False,dpi=300)
-        self.ax1 = self.fig.add_subplot(111,facecolor=self.ax_fc)
+        self.fig = None
+        self.ax1 = None
         self.ax2 = None
+        self._axes_dirty = False
 
         self.marker_density_x = 0.1
         self.marker_density_y = 0.1
@@ -529,12 +968,15 @@ class PAticAnimator(object):
 
         if field is None:
             self.field = None
+            self.complex_field = False
 
             self.nx = None
             self.x = None
+            self._x1d = None
 
             self.ny = None
             self.y = None
+            self._y1d = None
 
             self.nt = None
 
@@ -546,63 +988,45 @@ class PAticAnimator(object):
                 self.y1 = None    
             elif (x is not None and y is None) or (x is None and y is not None):
                 if x is not None:
-                    self._check_coordinate(x)
-
-                    self.x0 = np.min(x)
-                    self.x1 = np.max(x)
-
-                    self.y0 = np.min(x)
-                    self.y1 = np.max(x)
+                    self.x0,self.x1 = self._check_coordinate(x)
+                    self.y0,self.y1 = self.x0,self.x1
                 elif y is not None:
-                    self._check_coordinate(y)
-
-                    self.x0 = np.min(y)
-                    self.x1 = np.max(y)
-
-                    self.y0 = np.min(y)
-                    self.y1 = np.max(y)
+                    self.x0,self.x1 = self._check_coordinate(y)
+                    self.y0,self.y1 = self.x0,self.x1
             elif x is not None and y is not None:
-                self._check_coordinate(x)
-                self._check_coordinate(y)
-
-                self.x0 = np.min(x)
-                self.x1 = np.max(x)
-
-                self.y0 = np.min(y)
-                self.y1 = np.max(y)
+                self.x0,self.x1 = self._check_coordinate(x)
+                self.y0,self.y1 = self._check_coordinate(y)
         elif field is not None:
-            self._check_phi(field)
+            field = self._check_phi(field)
 
             self.nx = field.shape[2]
             self.ny = field.shape[1]
             self.nt = field.shape[0]
 
             self.field = field
+            self._decompose_field()
 
-            self._slc_x = self.nx//int(self.marker_density_x*self.nx)
-            self._slc_y = self.ny//int(self.marker_density_y*self.ny)
+            self._set_marker_slices()
 
             if x is None and y is None:
                 self._set_default_grid()
             elif (x is not None and y is None) or (x is None and y is not None):
                 if x is not None:
-                    self._check_coordinate(x)
-                    self._set_grid_from_coordinate(x,which='both')
+                    self._set_grid_from_coordinate(self._check_coordinate(x),which='both')
                 elif y is not None:
-                    self._check_coordinate(y)
-                    self._set_grid_from_coordinate(y,which='both')
+                    self._set_grid_from_coordinate(self._check_coordinate(y),which='both')
             elif x is not None and y is not None:
-                self._check_coordinate(x)
-                self._check_coordinate(y)
-                self._set_grid_from_coordinate(x,which='x')
-                self._set_grid_from_coordinate(y,which='y')
+                self._set_grid_from_coordinate(self._check_coordinate(x),which='x')
+                self._set_grid_from_coordinate(self._check_coordinate(y),which='y')
 
             self._set_marker_size()
 
     def _check_phi(self,field):
         '''
         Internal method for checking that the phase field array is of the correct type and has the
-        right shape.
+        right shape, and for recording whether it is complex. The validated array is returned in
+        C-contiguous single precision (complex64 for complex input, float32 otherwise), which
+        halves the amount of data that has to be read for every frame of the animation.
 
         Called in:
             - __init__
@@ -613,41 +1037,173 @@ class PAticAnimator(object):
         '''
         if not isinstance(field,np.ndarray):
             raise TypeError("""field must be of type <class 'numpy.ndarray'>.""")
-        elif isinstance(field,np.ndarray) and len(field.shape) != 3:
+        elif field.ndim != 3:
             raise Exception("""field must be a three-dimensional array with shape (nt,ny,nx).""")
 
-        # if field.dtype == np.complex_:
-        #     self.field_type = 'complex'
+        self.complex_field = np.issubdtype(field.dtype,np.complexfloating)
+
+        if self.complex_field:
+            return np.ascontiguousarray(field,dtype=np.complex64)
+        else:
+            return np.ascontiguousarray(field,dtype=np.float32)
+
+    def _decompose_field(self):
+        '''
+        Internal method for computing the phase (and, unless plotting the director, the magnitude)
+        of the phase field array. Both only depend on the phase field data, so they are computed
+        once when the data is supplied rather than every time the plot is initialized. For complex
+        input the phase is written straight into a preallocated array with np.arctan2, which avoids
+        the temporaries of np.angle, and with numba the phase, magnitude and their extrema come out
+        of one fused pass. Either way the phase already lies in [-pi,pi], so it never has to be
+        wrapped before the colormap lookup. The extrema of the phase and magnitude are stored as
+        well, so that the color limits don't have to be found by scanning the whole array again
+        every time they are needed in _initialize_plot and _draw_frame. For a complex field, the
+        magnitude normalized to [0,1], which sets the transparency of the phase field plot, is
+        computed here once as well. When plotting the director, the phase field is replaced by the
+        director angle thetas/p here, so that it isn't recomputed on every preview or animate call.
+
+        Called in:
+            - __init__
+            - set_phi
+
+        Calls on:
+            - _decompose_complex
+        '''
+        if self.complex_field:
+            self.thetas,rs,extrema = _decompose_complex(self.field,not self.director)
+            self._thetas_min,self._thetas_max = extrema[0],extrema[1]
+
+            if not self.director:
+                self.rs = rs
+                self._rs_min,self._rs_max = extrema[2],extrema[3]
+        else:
+            self.thetas = np.angle(self.field)
+            self._thetas_min = self.thetas.min()
+            self._thetas_max = self.thetas.max()
+
+            if not self.director:
+                self.rs = np.abs(self.field)
+                self._rs_min = self.rs.min()
+                self._rs_max = self.rs.max()
+
+        if self.field_type == 'complex' and not self.director:
+            self.rs_norm = np.subtract(self.rs,self._rs_min)
+            np.divide(self.rs_norm,self._rs_max - self._rs_min,out=self.rs_norm)
+        else:
+            self.rs_norm = None
+
+        if self.director:
+            self.field = self.thetas/self.p
+            self._field_min = self._thetas_min/self.p
+            self._field_max = self._thetas_max/self.p
 
     def _check_coordinate(self,c):
         '''
         Internal method for checking that the coordinate inputs have the correct type and shape.
+        Returns the lower and upper limits of the coordinate input, so that they are extracted in
+        the same step as they are checked.
 
         Called in:
             - __init__
             - set_grid
 
         Calls on:
-            - None
+            - _validate_limits
+            - _minmax
         '''
-        if isinstance(c,tuple) or isinstance(c,list):
-            if len(c) != 2:
-                raise ValueError("""The coordinate limits must be given as a tuple or list of two numbers.""")
-
-            for ci in c:
-                if not (isinstance(ci,float) or isinstance(ci,int)):
-                    raise ValueError("""The coordinate limits must be numbers.""")
-
-            if c[1] <= c[0]:
-                raise ValueError("""The upper coordinate limit must be greater than the lower coordinate limit.""")
+        if isinstance(c,(tuple,list)):
+            return self._validate_limits(c)
         elif isinstance(c,np.ndarray):
             if len(c.shape) > 2:
                 raise Exception("""The coordinate array must either be one- or two-dimensional.""")
             elif self.field is not None and len(c.shape) == 2 and c.shape != self.field.shape[1:]: # ---------------------------------------------------- CHECK IF THIS IS NECESSARY
                 raise Exception("""The shape of the coordinate grid must be (ny,nx) = (field.shape[1],field.shape[2]) = %s.""" % (self.field.shape[1:],))
+            return self._minmax(c)
         else:
             raise TypeError("""The coordinate keyword arguments must be either of type <class 'tuple'>, <class 'list'> or <class 'numpy.ndarray'>.""")
 
+    @staticmethod
+    def _as_float(value,message):
+        '''
+        Internal method for converting the numeric input value of a setter method to a float. If
+        the conversion fails, a TypeError with the given message is raised.
+
+        Called in:
+            - _as_fraction
+            - set_marker_density
+            - set_marker_size
+            - set_marker_linewidth
+
+        Calls on:
+            - None
+        '''
+        try:
+            return float(value)
+        except (TypeError,ValueError):
+            raise TypeError(message)
+
+    @staticmethod
+    def _as_fraction(value,message):
+        '''
+        Internal method for converting the numeric input value of a setter method to a float
+        clamped to the interval [0,1]. If the conversion fails, a TypeError with the given message
+        is raised.
+
+        Called in:
+            - set_marker_transparency
+            - set_pf_transparency
+
+        Calls on:
+            - _as_float
+        '''
+        return min(1.0,max(0.0,PAticAnimator._as_float(value,message)))
+
+    def _validate_limits(self,c):
+        '''
+        Internal method for checking that coordinate limits given as a tuple or list consist of
+        two numbers in increasing order. The limits are converted to an array in one go and checked
+        by dtype rather than checking each element separately, and are returned as a pair of
+        floats.
+
+        Called in:
+            - _check_coordinate
+
+        Calls on:
+            - None
+        '''
+        try:
+            limits = np.asarray(c)
+        except ValueError:
+            raise ValueError("""The coordinate limits must be numbers.""")
+
+        if limits.shape != (2,):
+            raise ValueError("""The coordinate limits must be given as a tuple or list of two numbers.""")
+        elif not np.issubdtype(limits.dtype,np.number) or not np.isfinite(limits).all():
+            raise ValueError("""The coordinate limits must be numbers.""")
+        elif limits[1] <= limits[0]:
+            raise ValueError("""The upper coordinate limit must be greater than the lower coordinate limit.""")
+
+        return float(limits[0]),float(limits[1])
+
+    def _minmax(self,c):
+        '''
+        Internal method for extracting the lower and upper limits from a coordinate input that has
+        already passed _check_coordinate. Tuples and lists already hold the limits in order, so no
+        reduction is needed, while arrays are flattened once and reduced with min and max.
+
+        Called in:
+            - _check_coordinate
+            - _set_grid_from_coordinate
+
+        Calls on:
+            - None
+        '''
+        if isinstance(c,(tuple,list)):
+            return c[0],c[1]
+        else:
+            c = np.ravel(c)
+            return float(c.min()),float(c.max())
+
     def _set_grid_from_coordinate(self,c,which=None):
         '''
         Internal method for constructing the coordinate grids from the user-supplied coordinate
@@ -655,28 +1211,63 @@ class PAticAnimator(object):
 
         Called in:
             - __init__
-            - set_grid
-            - set_phi
 
         Calls on:
-            - None
+            - _minmax
+            - _set_x_grid
+            - _set_y_grid
         '''
+        lo,hi = self._minmax(c)
+
         if which == "x":
-            self.x0 = np.min(c)
-            self.x1 = np.max(c)
-            self.x = np.tile(np.linspace(self.x0,self.x1,self.nx),(self.ny,1))
+            self.x0 = lo
+            self.x1 = hi
+            self._set_x_grid()
         elif which == "y":
-            self.y0 = np.min(c)
-            self.y1 = np.max(c)
-            self.y = np.tile(np.linspace(self.y0,self.y1,self.ny),(self.nx,1)).T
+            self.y0 = lo
+            self.y1 = hi
+            self._set_y_grid()
         elif which == "both":
-            self.x0 = np.min(c)
-            self.x1 = np.max(c)
+            self.x0 = lo
+            self.x1 = hi
+
+            self.y0 = lo
+            self.y1 = hi
+
+            self._set_x_grid()
+            self._set_y_grid()
+
+    def _set_x_grid(self):
+        '''
+        Internal method for constructing the x-coordinate grid from the stored limits x0 and x1,
+        which are already known to be ordered, so nothing has to be checked or reduced again.
+
+        Called in:
+            - _set_grid_from_coordinate
+            - set_grid
+            - set_phi
+
+        Calls on:
+            - None
+        '''
+        self._x1d = np.linspace(self.x0,self.x1,self.nx)
+        self.x = self._x1d[np.newaxis,:]
 
-            self.y0 = np.min(c)
-            self.y1 = np.max(c)
+    def _set_y_grid(self):
+        '''
+        Internal method for constructing the y-coordinate grid from the stored limits y0 and y1,
+        which are already known to be ordered, so nothing has to be checked or reduced again.
 
-            self.x,self.y = np.meshgrid(np.linspace(self.x0,self.x1,self.nx),np.linspace(self.y0,self.y1,self.ny))
+        Called in:
+            - _set_grid_from_coordinate
+            - set_grid
+            - set_phi
+
+        Calls on:
+            - None
+        '''
+        self._y1d = np.linspace(self.y0,self.y1,self.ny)
+        self.y = self._y1d[:,np.newaxis]
 
     def _set_default_grid(self):
         '''
@@ -688,7 +1279,7 @@ class PAticAnimator(object):
             - set_phi
 
         Calls on:
-            - None
+            - _default_grid
         '''
         self.x0 = 0
         self.x1 = 1
@@ -696,7 +1287,217 @@ class PAticAnimator(object):
         self.y0 = 0
         self.y1 = 1
 
-        self.x,self.y = np.meshgrid(np.linspace(self.x0,self.x1,self.nx),np.linspace(self.y0,self.y1,self.ny))
+        self._x1d,self._y1d = _default_grid(self.nx,self.ny)
+        self.x = self._x1d[np.newaxis,:]
+        self.y = self._y1d[:,np.newaxis]
+
+    def __getstate__(self):
+        '''
+        Collects the attributes of the animator object for pickling. The figure, its axes and the
+        artists drawn on them are left out, because they are rebuilt from the remaining attributes
+        the next time the plot is initialized.
+
+        Called in:
+            - PAticAnimator.animate (through pickling)
+        '''
+        return {name:getattr(self,name) for name in self.__slots__ if name not in self._figure_slots and hasattr(self,name)}
+
+    def __setstate__(self,state):
+        '''
+        Restores the attributes of an unpickled animator object. The figure and its axes are set to
+        None, so that they are created anew by _ensure_figure.
+
+        Called in:
+            - PAticAnimator.animate (through unpickling)
+        '''
+        self.fig = None
+        self.ax1 = None
+        self.ax2 = None
+        self._axes_dirty = False
+        for name,value in state.items():
+            setattr(self,name,value)
+
+    def _ensure_figure(self):
+        '''
+        Internal method for creating the figure and its axes the first time they are needed. The
+        layout follows the current plotting configuration, i.e. two side by side axes when the
+        phase field and order parameter are plotted separately, and a single axes otherwise. The
+        setters only flag a change of layout, so the axes of an existing figure are rebuilt here,
+        once, right before they are drawn on.
+
+        Called in:
+            - _initialize_plot
+
+        Calls on:
+            - None
+        '''
+        if self.fig is not None and not self._axes_dirty:
+            return
+
+        if self.which == "both" and self.grouping == "separate" and self.field_type != 'complex':
+            size = (24.0,10.0)
+        else:
+            size = (12.0,10.0)
+
+        if self.fig is None:
+            self.fig = plt.figure(figsize=size,frameon=False,dpi=300)
+        else:
+            self.fig.clear()
+            self.fig.set_size_inches(size)
+
+        if size[0] == 24.0:
+            self.ax1 = self.fig.add_subplot(121,facecolor=self.ax_fc)
+            self.ax2 = self.fig.add_subplot(122,facecolor='whitesmoke')
+        else:
+            self.ax1 = self.fig.add_subplot(111,facecolor=self.ax_fc)
+            self.ax2 = None
+
+        self._axes_dirty = False
+
+    def _set_marker_grid(self):
+        '''
+        Internal method for constructing the subsampled coordinate vectors on which the order
+        parameter markers are placed. Only these small vectors are needed for the markers, so the
+        marker positions never have to be sliced out of the full coordinate grid. The C-contiguous 2D
+        marker grids shared by all quiver and scatter artists are built once here. The flat indices
+        of the marker positions in the phase field grid are precomputed here as well, together
+        with the buffers that the per-frame marker values and arrow components are written into.
+
+        Called in:
+            - _initialize_plot
+
+        Calls on:
+            - None
+        '''
+        self._x_markers = self._x1d[::self._slc_x]
+        self._y_markers = self._y1d[::self._slc_y]
+        self._xs,self._ys = np.meshgrid(self._x_markers,self._y_markers)
+
+        self._marker_idx_y = np.arange(0,self.ny,self._slc_y)
+        self._marker_idx_x = np.arange(0,self.nx,self._slc_x)
+        self._marker_idx = (self._marker_idx_y[:,np.newaxis]*self.nx + self._marker_idx_x[np.newaxis,:]).ravel()
+        self._mbuf = np.empty(self._marker_idx.size,dtype=self.thetas.dtype)
+        self._rbuf = np.empty_like(self._mbuf)
+        self._ubuf = np.empty_like(self._mbuf)
+        self._vbuf = np.empty_like(self._mbuf)
+
+    def _marker_values(self,a,i):
+        '''
+        Internal method for gathering the values of the array a at time step i at the positions of
+        the order parameter markers. The values are taken with the flat marker indices into the
+        preallocated marker buffer, so that no new array is allocated for every frame.
+
+        Called in:
+            - _marker_vectors
+            - _draw_frame
+
+        Calls on:
+            - _gather_marker_values
+        '''
+        return _gather_marker_values(a[i].ravel(),self._marker_idx,self._mbuf)
+
+    def _pcolor(self,C,**kwargs):
+        '''
+        Internal method for drawing the phase field C on the first axes, with every cell centered on
+        its grid point. The grid is always uniform, so large phase fields are drawn as an image
+        with pcolorfast, which is rasterized at a cost set by the size of the axes rather than by
+        the number of cells. Below about one cell per 16 display pixels of the axes, a QuadMesh is
+        cheaper to draw; then pcolormesh is used instead. Both artists are updated with set_array.
+
+        Called in:
+            - _initialize_plot
+
+        Calls on:
+            - None
+        '''
+        if self.nx*self.ny > self.ax1.bbox.width*self.ax1.bbox.height/16:
+            dx = (self.x1 - self.x0)/(2*(self.nx - 1)) if self.nx > 1 else 0.5
+            dy = (self.y1 - self.y0)/(2*(self.ny - 1)) if self.ny > 1 else 0.5
+
+            return self.ax1.pcolorfast((self.x0 - dx,self.x1 + dx),(self.y0 - dy,self.y1 + dy),C,**kwargs)
+        else:
+            return self.ax1.pcolormesh(self._x1d,self._y1d,C,shading='nearest',**kwargs)
+
+    def _to_rgba(self,values,alpha=None):
+        '''
+        Internal method for mapping the values onto the colormap as 8-bit RGBA colors, using the
+        color limits of the ScalarMappable. The colors are looked up in the table of the colormap
+        built in _initialize_plot, and every intermediate result is written into the preallocated
+        buffers, so that no new (ny,nx,4) array is allocated for every frame. NaN values are sent to
+        the last row of the table, which holds the "bad" color of the colormap. If alpha is given,
+        either as a scalar or as an array of the same shape as values, it replaces the alpha channel
+        of the colormap. Returns the RGBA buffer.
+
+        Called in:
+            - _initialize_plot
+            - _draw_frame
+
+        Calls on:
+            - None
+        '''
+        vmin,vmax = self.SM.get_clim()
+        n = self._lut.shape[0] - 1
+        scale = n/(vmax - vmin) if vmax > vmin else 0
+
+        np.subtract(values,vmin,out=self._cbuf)
+        np.multiply(self._cbuf,scale,out=self._cbuf)
+        np.clip(self._cbuf,0,n-1,out=self._cbuf)
+        np.isnan(self._cbuf,out=self._nbuf)
+        np.copyto(self._cbuf,n,where=self._nbuf)
+        np.copyto(self._ibuf,self._cbuf,casting='unsafe')
+        np.take(self._lut,self._ibuf,axis=0,out=self.RGBA)
+
+        if alpha is None:
+            pass
+        elif np.ndim(alpha) == 0:
+            self.RGBA[:,:,3] = int(255*alpha)
+        else:
+            np.multiply(alpha,255,out=self._cbuf)
+            np.isnan(self._cbuf,out=self._nbuf)
+            np.copyto(self._cbuf,0,where=self._nbuf)
+            np.copyto(self.RGBA[:,:,3],self._cbuf,casting='unsafe')
+
+        return self.RGBA
+
+    def _marker_vectors(self,i):
+        '''
+        Internal method for computing the components of the order parameter arrows at time step i.
+        The components are only computed at the positions of the markers, and are written into the
+        preallocated marker buffers rather than into new full-size arrays. Returns the x and y
+        components and the phase at the marker positions. The director arrows (p = 1) have unit
+        length, so only the magnitude of a complex phase field scales the arrows.
+
+        Called in:
+            - _initialize_plot
+            - _draw_frame
+
+        Calls on:
+            - _marker_values
+            - _gather_marker_values
+        '''
+        thetas = self._marker_values(self.thetas,i)
+        np.cos(thetas,out=self._ubuf)
+        np.sin(thetas,out=self._vbuf)
+
+        if self.field_type == 'complex' and not self.director:
+            rs = _gather_marker_values(self.rs[i].ravel(),self._marker_idx,self._rbuf)
+            np.multiply(rs,self._ubuf,out=self._ubuf)
+            np.multiply(rs,self._vbuf,out=self._vbuf)
+
+        return self._ubuf,self._vbuf,thetas
+
+    def _arrow_scale(self):
+        '''
+        Internal method for computing the quiver scale of the order parameter arrows from the extent
+        of the x-axis.
+
+        Called in:
+            - _initialize_plot
+
+        Calls on:
+            - None
+        '''
+        return 1/(2*np.log10(np.abs(self.x1-self.x0)))
 
     def _initialize_plot(self):
         '''
@@ -704,188 +1505,172 @@ class PAticAnimator(object):
         parameter to plot, how they're grouped and what mode they're to be displayed in.
 
         Called in:
+            - _start_blit
             - preview
-            - animate
+            - saveframe
 
         Calls on:
+            - _ensure_figure
+            - _set_marker_grid
+            - _marker_vectors
+            - _arrow_scale
+            - _to_rgba
+            - _pcolor
             - _set_marker
+            - _pi_tick_labels
         '''
+        self._ensure_figure()
+
         self.ax1.set_facecolor(self.ax_fc)
         self.SM = ScalarMappable(cmap=self.colormap)
 
+        self._set_marker_grid()
+        xs,ys = self._xs,self._ys
+
         if not self.director:
-            self.rs = np.abs(self.field)
-            self.thetas = np.angle(self.field)
+            ticks = np.linspace(self._thetas_min,self._thetas_max,9)
+            tick_labels = _pi_tick_labels(4)
 
-            tick_labels = []
-            for m in range(9):
-                n = np.abs(4-m)
-                d = 4
-
-                nr = n/np.gcd(n,d)
-                dr = d/np.gcd(n,d)
-
-                if m < 4:
-                    if nr == 1 and dr == 1:
-                        label = r'$-\pi$'
-                    elif nr == 1:
-                        label = r'$-\frac{\pi}{%d}$' % dr
-                    elif dr == 1:
-                        label = r'$-%d\pi$' % nr
-                    else:
-                        label = r'$-\frac{%d\pi}{%d}$' % (nr,dr)
-                elif m == 4:
-                    label = r'$0$'
-                else:
-                    if nr == 1 and dr == 1:
-                        label = r'$\pi$'
-                    elif nr == 1:
-                        label = r'$\frac{\pi}{%d}$' % dr
-                    elif dr == 1:
-                        label = r'$%d\pi$' % nr
-                    else:
-                        label = r'$\frac{%d\pi}{%d}$' % (nr,dr)
-                tick_labels.append(label)
+            self._lut = np.vstack((self.SM.cmap(np.arange(self.SM.cmap.N),bytes=True),self.SM.cmap(np.nan,bytes=True)))
+            self._cbuf = np.empty((self.ny,self.nx),dtype=self.thetas.dtype)
+            self._ibuf = np.empty((self.ny,self.nx),dtype=np.intp)
+            self._nbuf = np.empty((self.ny,self.nx),dtype=bool)
+            self.RGBA = np.empty((self.ny,self.nx,4),dtype=np.uint8)
 
             if self.field_type == 'complex':
-                self.rs_norm = (self.rs - np.min(self.rs))/(np.max(self.rs) - np.min(self.rs))
-
-                self.SM.set_clim([np.min(self.thetas),np.max(self.thetas)])
-                self.RGBA = self.SM.to_rgba(self.thetas[0,:,:])
+                self.SM.set_clim([self._thetas_min,self._thetas_max])
 
                 if self.which == 'pf':
-                    self.RGBA[:,:,-1] = self.rs_norm[0,:,:]
-                    self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
+                    self.RGBA = self._to_rgba(self.thetas[0,:,:],alpha=self.rs_norm[0,:,:])
+                    self.cont = self._pcolor(self.RGBA,cmap=self.colormap,vmin=self._thetas_min,vmax=self._thetas_max,zorder=0)
                 elif self.which == 'op':
-                    self._vx = self.rs[0,:,:]*np.cos(self.thetas[0,:,:])
-                    self._vy = self.rs[0,:,:]*np.sin(self.thetas[0,:,:])
-
-                    self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],
+                    U,V,C = self._marker_vectors(0)
+                    self.arrow = self.ax1.quiver(xs,ys,U,V,
                                                  color='k',
                                                  pivot='mid',
                                                  width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                 scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                 scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                 elif self.which == 'both':
-                    self.RGBA[:,:,-1] = self.pf_transparency
-
-                    self._vx = self.rs[0,:,:]*np.cos(self.thetas[0,:,:])
-                    self._vy = self.rs[0,:,:]*np.sin(self.thetas[0,:,:])
+                    self.RGBA = self._to_rgba(self.thetas[0,:,:],alpha=self.pf_transparency)
 
                     if self.mode == 0:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
-                        self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],
+                        self.cont = self._pcolor(self.RGBA,cmap=self.colormap,vmin=self._thetas_min,vmax=self._thetas_max,zorder=0)
+                        U,V,C = self._marker_vectors(0)
+                        self.arrow = self.ax1.quiver(xs,ys,U,V,
                                                      color='k',
                                                      pivot='mid',
                                                      width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                     scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                     scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                     elif self.mode == 1:
-                        self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[0,::self._slc_y,::self._slc_x],
+                        U,V,C = self._marker_vectors(0)
+                        self.arrow = self.ax1.quiver(xs,ys,U,V,C,
                                                      cmap=self.colormap,
                                                      pivot='mid',
                                                      width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                     scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                     scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                     elif self.mode == 2:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
-                        self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[0,::self._slc_y,::self._slc_x],
+                        self.cont = self._pcolor(self.RGBA,cmap=self.colormap,vmin=self._thetas_min,vmax=self._thetas_max,zorder=0)
+                        U,V,C = self._marker_vectors(0)
+                        self.arrow = self.ax1.quiver(xs,ys,U,V,C,
                                                      cmap=self.colormap,
                                                      pivot='mid',
                                                      width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                     scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                     scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                 if self.which != 'op':
-                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.thetas),np.max(self.thetas),9))
+                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=ticks)
                     self.CB.set_label(r'$\text{arg}\left(\Psi_p\right)$',rotation='vertical',fontsize=self.CB_label_fontsize)
                     self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
                     self.CB.ax.set_facecolor(self.ax_fc)
                     self.CB.set_ticklabels(tick_labels)
             elif self.field_type == 'phase':
-                self.SM.set_clim([np.min(self.thetas),np.max(self.thetas)])
-                self.RGBA = self.SM.to_rgba(self.thetas[0,:,:])
-
-                self._vx = np.cos(self.thetas[0,:,:])
-                self._vy = np.sin(self.thetas[0,:,:])
+                self.SM.set_clim([self._thetas_min,self._thetas_max])
+                self.RGBA = self._to_rgba(self.thetas[0,:,:])
 
                 if self.which == 'pf':
-                    self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
+                    self.cont = self._pcolor(self.RGBA,cmap=self.colormap,vmin=self._thetas_min,vmax=self._thetas_max,zorder=0)
                 elif self.which == 'op':
-                    self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],
+                    U,V,C = self._marker_vectors(0)
+                    self.arrow = self.ax1.quiver(xs,ys,U,V,
                                                  color='k',
                                                  pivot='mid',
                                                  width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                 scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                 scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                 elif self.which == 'both':
                     if self.mode == 0:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
-                        self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],
+                        self.cont = self._pcolor(self.RGBA,cmap=self.colormap,vmin=self._thetas_min,vmax=self._thetas_max,zorder=0)
+                        U,V,C = self._marker_vectors(0)
+                        self.arrow = self.ax1.quiver(xs,ys,U,V,
                                                      color='k',
                                                      pivot='mid',
                                                      width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                     scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                     scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                     elif self.mode == 1:
-                        self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[0,::self._slc_y,::self._slc_x],
+                        U,V,C = self._marker_vectors(0)
+                        self.arrow = self.ax1.quiver(xs,ys,U,V,C,
                                                      cmap=self.colormap,
                                                      pivot='mid',
                                                      width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                     scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                     scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                     elif self.mode == 2:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
-                        self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[0,::self._slc_y,::self._slc_x],
+                        self.cont = self._pcolor(self.RGBA,cmap=self.colormap,vmin=self._thetas_min,vmax=self._thetas_max,zorder=0)
+                        U,V,C = self._marker_vectors(0)
+                        self.arrow = self.ax1.quiver(xs,ys,U,V,C,
                                                      cmap=self.colormap,
                                                      pivot='mid',
                                                      width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                     scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                     scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                 if self.which != 'op':
-                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.thetas),np.max(self.thetas),9))
+                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=ticks)
                     self.CB.set_label(r'$\text{arg}\left(\Psi_p\right)$',rotation='vertical',fontsize=self.CB_label_fontsize)
                     self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
                     self.CB.ax.set_facecolor(self.ax_fc)
                     self.CB.set_ticklabels(tick_labels)
             elif self.field_type == 'magnitude':
                 self.SM.set_clim([0,1])
-                self.RGBA = self.SM.to_rgba(self.rs[0,:,:])
+                self.RGBA = self._to_rgba(self.rs[0,:,:])
+
+                ticks = np.linspace(self._rs_min,self._rs_max,9)
+                tick_labels = [str(tick) for tick in np.linspace(0,1,9)]
 
-                self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.rs),vmax=np.max(self.rs),zorder=0)
-                self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.rs),np.max(self.rs),9))
+                self.cont = self._pcolor(self.RGBA,cmap=self.colormap,vmin=self._rs_min,vmax=self._rs_max,zorder=0)
+                self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=ticks)
                 self.CB.set_label(r'$\left|\Psi_p\right|\,\left[\left|\Psi_0\right|\right]$',rotation='vertical',fontsize=self.CB_label_fontsize)
                 self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
                 self.CB.ax.set_facecolor(self.ax_fc)
-
-                ticks = np.linspace(0,1,9)
-                tick_labels = [str(tick) for tick in ticks]
                 self.CB.set_ticklabels(tick_labels)
             self.ax1.set_xlim([self.x0,self.x1])
             self.ax1.set_ylim([self.y0,self.y1])
         else:
-            self.field = np.angle(self.field)/self.p
-            if self.p == 1:
-                self._vx = np.cos(self.field)
-                self._vy = np.sin(self.field)
+            f0 = self.field[0,:,:]
+            c0 = f0[::self._slc_y,::self._slc_x]
 
             if self.which == "both" and self.grouping == "separate":
-                self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[0,:,:],shading='nearest',
-                                                cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
+                self.cont = self._pcolor(f0,
+                                         cmap=self.colormap,alpha=self.pf_transparency,vmin=self._field_min,vmax=self._field_max,zorder=0)
                 if self.p == 1:
-                    self.arrow = self.ax2.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[0,::self._slc_y,::self._slc_x],self._vy[0,::self._slc_y,::self._slc_x],
+                    U,V,C = self._marker_vectors(0)
+                    self.arrow = self.ax2.quiver(xs,ys,U,V,
                                                  color='k',
                                                  pivot='mid',
                                                  width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                 scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                 scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                 else:
-                    self.patch = self.ax2.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                  marker=self._markers["patch"],
+                    self.patch = self.ax2.scatter(xs,ys,
+                                                  marker=self._marker_paths["patch"],
                                                   s=self.marker_size,
                                                   c=self.marker_colors["patch"],
                                                   alpha=self.marker_transparencies["patch"],
                                                   linewidths=self.marker_linewidths["patch"],
                                                   zorder=1)
-                    self.point = self.ax2.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                  marker=self._markers["point"],
+                    self.point = self.ax2.scatter(xs,ys,
+                                                  marker=self._marker_paths["point"],
                                                   s=self.marker_size,
                                                   c=self.marker_colors["point"],
                                                   alpha=self.marker_transparencies["point"],
                                                   linewidths=self.marker_linewidths["point"],
                                                   zorder=2)
-                    self.tick = self.ax2.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                 marker=self._markers["tick"],
+                    self.tick = self.ax2.scatter(xs,ys,
+                                                 marker=self._marker_paths["tick"],
                                                  s=self.marker_size,
                                                  c=self.marker_colors["tick"],
                                                  alpha=self.marker_transparencies["tick"],
@@ -898,35 +1683,36 @@ class PAticAnimator(object):
                 self.ax2.set_ylim([self.y0,self.y1])
             else:
                 if self.which == "pf":
-                    self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[0,:,:],shading='nearest',
-                                                    cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
+                    self.cont = self._pcolor(f0,
+                                             cmap=self.colormap,alpha=self.pf_transparency,vmin=self._field_min,vmax=self._field_max,zorder=0)
                 elif self.which == "op":
                     self.fig.set_figheight(10.0)
                     self.fig.set_figwidth(10.0)
 
                     if self.p == 1:
-                        self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[0,::self._slc_y,::self._slc_x],self._vy[0,::self._slc_y,::self._slc_x],
+                        U,V,C = self._marker_vectors(0)
+                        self.arrow = self.ax1.quiver(xs,ys,U,V,
                                                      color='k',
                                                      pivot='mid',
                                                      width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                     scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                     scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                     else:
-                        self.patch = self.ax1.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                      marker=self._markers["patch"],
+                        self.patch = self.ax1.scatter(xs,ys,
+                                                      marker=self._marker_paths["patch"],
                                                       s=self.marker_size,
                                                       c=self.marker_colors["patch"],
                                                       alpha=self.marker_transparencies["patch"],
                                                       linewidths=self.marker_linewidths["patch"],
                                                       zorder=1)
-                        self.point = self.ax1.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                      marker=self._markers["point"],
+                        self.point = self.ax1.scatter(xs,ys,
+                                                      marker=self._marker_paths["point"],
                                                       s=self.marker_size,
                                                       c=self.marker_colors["point"],
                                                       alpha=self.marker_transparencies["point"],
                                                       linewidths=self.marker_linewidths["point"],
                                                       zorder=2)
-                        self.tick = self.ax1.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                     marker=self._markers["tick"],
+                        self.tick = self.ax1.scatter(xs,ys,
+                                                     marker=self._marker_paths["tick"],
                                                      s=self.marker_size,c=self.marker_colors["tick"],
                                                      alpha=self.marker_transparencies["tick"],
                                                      linewidths=self.marker_linewidths["tick"],
@@ -935,61 +1721,64 @@ class PAticAnimator(object):
                         self._set_marker()
                 elif self.which == "both":
                     if self.mode == 0:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[0,:,:],shading='nearest',
-                                                        cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
+                        self.cont = self._pcolor(f0,
+                                                 cmap=self.colormap,alpha=self.pf_transparency,vmin=self._field_min,vmax=self._field_max,zorder=0)
                         if self.p == 1:
-                            self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[0,::self._slc_y,::self._slc_x],self._vy[0,::self._slc_y,::self._slc_x],
+                            U,V,C = self._marker_vectors(0)
+                            self.arrow = self.ax1.quiver(xs,ys,U,V,
                                                          color='k',
                                                          pivot='mid',
                                                          width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                         scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                         scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                         else:
                             point_kwarg = {"c":self.marker_colors["point"]}
                             patch_kwarg = {"c":self.marker_colors["patch"]}
                     elif self.mode == 1:
                         if self.p == 1:
-                            self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[0,::self._slc_y,::self._slc_x],self._vy[0,::self._slc_y,::self._slc_x],self.field[0,::self._slc_y,::self._slc_x],
+                            U,V,C = self._marker_vectors(0)
+                            self.arrow = self.ax1.quiver(xs,ys,U,V,C,
                                                          cmap=self.colormap,
                                                          pivot='mid',
                                                          width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                         scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                         scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                         elif self.p == 2:
-                            point_kwarg = {"c":self.field[0,::self._slc_y,::self._slc_x],"cmap":self.colormap}
+                            point_kwarg = {"c":c0,"cmap":self.colormap}
                         else:
                             point_kwarg = {"c":self.marker_colors["point"]}
-                        patch_kwarg = {"c":self.field[0,::self._slc_y,::self._slc_x],"cmap":self.colormap,"vmin":np.min(self.field[0,:,:]),"vmax":np.max(self.field[0,:,:])}
+                        patch_kwarg = {"c":c0,"cmap":self.colormap,"vmin":np.min(f0),"vmax":np.max(f0)}
                     elif self.mode == 2:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[0,:,:],shading='nearest',
-                                                        cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
+                        self.cont = self._pcolor(f0,
+                                                 cmap=self.colormap,alpha=self.pf_transparency,vmin=self._field_min,vmax=self._field_max,zorder=0)
                         if self.p == 1:
-                            self.arrow = self.ax1.quiver(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],self._vx[0,::self._slc_y,::self._slc_x],self._vy[0,::self._slc_y,::self._slc_x],self.field[0,::self._slc_y,::self._slc_x],
+                            U,V,C = self._marker_vectors(0)
+                            self.arrow = self.ax1.quiver(xs,ys,U,V,C,
                                                          cmap=self.colormap,
                                                          pivot='mid',
                                                          width=0.0025,headwidth=2.5,headlength=5,headaxislength=4.5,
-                                                         scale_units='xy',angles='xy',scale=(1/(2*np.log10(np.abs(self.x1-self.x0)))),zorder=1)
+                                                         scale_units='xy',angles='xy',scale=self._arrow_scale(),zorder=1)
                         elif self.p == 2:
-                            point_kwarg = {"c":self.field[0,::self._slc_y,::self._slc_x],"cmap":self.colormap}
+                            point_kwarg = {"c":c0,"cmap":self.colormap}
                         else:
                             point_kwarg = {"c":self.marker_colors["point"]}
-                        patch_kwarg = {"c":self.field[0,::self._slc_y,::self._slc_x],"cmap":self.colormap,"vmin":np.min(self.field[0,:,:]),"vmax":np.max(self.field[0,:,:])}
+                        patch_kwarg = {"c":c0,"cmap":self.colormap,"vmin":np.min(f0),"vmax":np.max(f0)}
 
                     if self.p > 1:
-                        self.patch = self.ax1.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                      marker=self._markers["patch"],
+                        self.patch = self.ax1.scatter(xs,ys,
+                                                      marker=self._marker_paths["patch"],
                                                       s=self.marker_size,
                                                       alpha=self.marker_transparencies["patch"],
                                                       linewidths=self.marker_linewidths["patch"],
                                                       zorder=1,
                                                       **patch_kwarg)
-                        self.point = self.ax1.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                      marker=self._markers["point"],
+                        self.point = self.ax1.scatter(xs,ys,
+                                                      marker=self._marker_paths["point"],
                                                       s=self.marker_size,
                                                       alpha=self.marker_transparencies["point"],
                                                       linewidths=self.marker_linewidths["point"],
                                                       zorder=2,
                                                       **point_kwarg)
-                        self.tick = self.ax1.scatter(self.x[::self._slc_y,::self._slc_x],self.y[::self._slc_y,::self._slc_x],
-                                                     marker=self._markers["tick"],
+                        self.tick = self.ax1.scatter(xs,ys,
+                                                     marker=self._marker_paths["tick"],
                                                      s=self.marker_size,
                                                      c=self.marker_colors["tick"],
                                                      alpha=self.marker_transparencies["tick"],
@@ -1002,45 +1791,19 @@ class PAticAnimator(object):
             self.ax1.set_ylim([self.y0,self.y1])
 
             if self.which != 'op':
+                ticks = np.linspace(self._field_min,self._field_max,9)
+
                 if self.grouping == 'together' and self.mode == 1:
-                    self.SM.set_clim([np.min(self.field),np.max(self.field)])
-                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.field),np.max(self.field),9))
+                    self.SM.set_clim([self._field_min,self._field_max])
+                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=ticks)
                 else:
-                    self.cont.set_clim([np.min(self.field),np.max(self.field)])
-                    self.CB = self.fig.colorbar(self.cont,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.field),np.max(self.field),9))
+                    self.cont.set_clim([self._field_min,self._field_max])
+                    self.CB = self.fig.colorbar(self.cont,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=ticks)
                 self.CB.ax.set_facecolor(self.ax_fc)
                 self.CB.set_label(r'$\text{arg}\left(\mathbf{n}^{(%d)}\right)$' % self.p,rotation='vertical',fontsize=self.CB_label_fontsize)
                 self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
 
-                tick_labels = []
-                for m in range(9):
-                    n = np.abs(4-m)
-                    d = 4*self.p
-
-                    nr = n/np.gcd(n,d)
-                    dr = d/np.gcd(n,d)
-
-                    if m < 4:
-                        if nr == 1 and dr == 1:
-                            label = r'$-\pi$'
-                        elif nr == 1:
-                            label = r'$-\frac{\pi}{%d}$' % dr
-                        elif dr == 1:
-                            label = r'$-%d\pi$' % nr
-                        else:
-                            label = r'$-\frac{%d\pi}{%d}$' % (nr,dr)
-                    elif m == 4:
-                        label = r'$0$'
-                    else:
-                        if nr == 1 and dr == 1:
-                            label = r'$\pi$'
-                        elif nr == 1:
-                            label = r'$\frac{\pi}{%d}$' % dr
-                        elif dr == 1:
-                            label = r'$%d\pi$' % nr
-                        else:
-                            label = r'$\frac{%d\pi}{%d}$' % (nr,dr)
-                    tick_labels.append(label)
+                tick_labels = _pi_tick_labels(4*self.p)
 
                 self.CB.set_ticklabels(tick_labels)
 
@@ -1054,10 +1817,28 @@ class PAticAnimator(object):
 
         self.fig.tight_layout()
 
+    def _set_marker_slices(self):
+        '''
+        Internal method for setting the strides with which the coordinate grid is subsampled for
+        the order parameter markers from the marker densities along the two axes.
+
+        Called in:
+            - __init__
+            - set_phi
+            - set_marker_density
+
+        Calls on:
+            - None
+        '''
+        self._slc_x = max(1,int(round(1.0/self.marker_density_x)))
+        self._slc_y = max(1,int(round(1.0/self.marker_density_y)))
+
     def _set_marker_size(self):
         '''
         Internal method for setting the marker size (p >= 3) or linewidths (p = 1,2) based on the
-        number of markers along the axis with the biggest number of points.
+        number of markers along the axis with the biggest number of points. The number of markers is
+        binned by tens into [<20,<30,<40,<50,>=50], which indexes the class-level size and linewidth
+        tables.
 
         Called in:
             - __init__
@@ -1068,67 +1849,17 @@ class PAticAnimator(object):
         Calls on:
             - None
         '''
-        nmax = np.max([self.nx,self.ny])
+        nmax = max(self.nx,self.ny)
         N = int(self.marker_density_x*nmax) if self.nx >= self.ny else int(self.marker_density_y*nmax)
 
-        if N >= 10 and N <= 60:
-            if N >= 10 and N < 20:
-                if self.p >= 3:
-                    self.marker_size = 140
-                else:
-                    self.marker_linewidths["point"] = 1.75
-                    self.marker_linewidths["tick"] = 1.75
-
-                    self.marker_size = 140
-            elif N >= 20 and N < 30:
-                if self.p >= 3:
-                    self.marker_size = 100
-                else:
-                    self.marker_linewidths["point"] = 1.0
-                    self.marker_linewidths["tick"] = 1.0
-
-                    self.marker_size = 140
-            elif N >= 30 and N < 40:
-                if self.p >= 3:
-                    self.marker_size = 60
-                else:
-                    self.marker_linewidths["point"] = 0.85
-                    self.marker_linewidths["tick"] = 0.85
-
-                    self.marker_size = 60
-            elif N >= 40 and N < 50:
-                if self.p >= 3:
-                    self.marker_size = 30
-                else:
-                    self.marker_linewidths["point"] = 0.85
-                    self.marker_linewidths["tick"] = 0.85
-
-                    self.marker_size = 45
-            elif N >= 50 and N <= 60:
-                if self.p >= 3:
-                    self.marker_size = 20
-                else:
-                    self.marker_linewidths["point"] = 0.85
-                    self.marker_linewidths["tick"] = 0.85
-
-                    self.marker_size = 30
-        elif N < 10:
-            N = 10
-            if self.p >= 3:
-                self.marker_size = 140
-            else:
-                self.marker_linewidths["point"] = 1.75
-                self.marker_linewidths["tick"] = 1.75
-
-                self.marker_size = 140
-        elif N > 60:
-            if self.p >= 3:
-                self.marker_size = 20
-            else:
-                self.marker_linewidths["point"] = 0.85
-                self.marker_linewidths["tick"] = 0.85
+        idx = min(max(N//10 - 1,0),4)
+        if self.p >= 3:
+            self.marker_size = self._marker_sizes_polygon[idx]
+        else:
+            self.marker_linewidths["point"] = self._marker_linewidths_line[idx]
+            self.marker_linewidths["tick"] = self._marker_linewidths_line[idx]
 
-                self.marker_size = 30
+            self.marker_size = self._marker_sizes_line[idx]
 
     def _set_marker(self):
         '''
@@ -1158,46 +1889,46 @@ class PAticAnimator(object):
         elif self.marker_type == "all":
             pass
 
-    def _update_markers(self,patch_markers,point_markers,tick_markers):
+    def _marker_style_paths(self,markers):
         '''
-        Internal method for setting the correct markers for every value of the phase field at a
-        given time step based on the inputs from the _init_frame and _draw_frame methods.
+        Internal method for converting a list of markers into the list of their paths. The paths
+        built in _draw_frame are already mpath.Path objects, in which case the list is returned as is
+        instead of wrapping every path in a MarkerStyle.
 
         Called in:
-            - _init_frame
-            - _draw_frame
+            - _update_markers
 
         Calls on:
             - None
         '''
-        patch_paths = []
-        point_paths = []
-        tick_paths = []
+        if len(markers) > 0 and isinstance(markers[0],mpath.Path):
+            return markers
 
-        for patch_marker,point_marker,tick_marker in zip(patch_markers,point_markers,tick_markers):
-            if isinstance(patch_marker, mmarkers.MarkerStyle):
-                patch_marker_obj = patch_marker
+        paths = []
+        for marker in markers:
+            if isinstance(marker,mmarkers.MarkerStyle):
+                marker_obj = marker
             else:
-                patch_marker_obj = mmarkers.MarkerStyle(patch_marker)
+                marker_obj = mmarkers.MarkerStyle(marker)
 
-            if isinstance(point_marker, mmarkers.MarkerStyle):
-                point_marker_obj = point_marker
-            else:
-                point_marker_obj = mmarkers.MarkerStyle(point_marker)
+            paths.append(marker_obj.get_path())
 
-            if isinstance(tick_marker, mmarkers.MarkerStyle):
-                tick_marker_obj = tick_marker
-            else:
-                tick_marker_obj = mmarkers.MarkerStyle(tick_marker)
+        return paths
 
-            patch_path = patch_marker_obj.get_path()#.transformed(patch_marker_obj.get_transform())
-            patch_paths.append(patch_path)
+    def _update_markers(self,patch_markers,point_markers,tick_markers):
+        '''
+        Internal method for setting the correct markers for every value of the phase field at a
+        given time step based on the inputs from the _init_frame and _draw_frame methods.
 
-            point_path = point_marker_obj.get_path()#.transformed(point_marker_obj.get_transform())
-            point_paths.append(point_path)
+        Called in:
+            - _draw_frame
 
-            tick_path = tick_marker_obj.get_path()#.transformed(tick_marker_obj.get_transform())
-            tick_paths.append(tick_path)
+        Calls on:
+            - _marker_style_paths
+        '''
+        patch_paths = self._marker_style_paths(patch_markers)
+        point_paths = self._marker_style_paths(point_markers)
+        tick_paths = self._marker_style_paths(tick_markers)
 
         if self.marker_type == "patch":
             self.patch.set_paths(patch_paths)
@@ -1219,241 +1950,180 @@ class PAticAnimator(object):
             self.point.set_paths(point_paths)
             self.tick.set_paths(tick_paths)
 
+    def _rotated_paths(self,name,angles):
+        '''
+        Internal method for constructing the paths of the marker sub-type name rotated by every one
+        of the given angles. The vertices of all markers are rotated at once by _rotate_vertices,
+        so only the paths themselves are built in Python, sharing the codes of the cached base path.
+
+        Called in:
+            - _draw_frame
+
+        Calls on:
+            - _rotate_vertices
+        '''
+        path = self._marker_paths[name]
+        rotated = _rotate_vertices(angles,path.vertices)
+
+        return [mpath.Path(vertices,path.codes) for vertices in rotated]
+
     def _draw_frame(self,i):
         '''
         Internal method for drawing every frame of the animation by updating the phase field and/
-        or order parameter markers based on the phase field value at time step i.
+        or order parameter markers based on the phase field value at time step i. The artists
+        created in _initialize_plot are updated in place, while the colorbar, whose limits are the
+        same for every frame, and the layout of the figure are left untouched. The director values
+        at the marker positions are gathered only once per frame and used both for the marker
+        orientations and for their colors.
 
         This method is also used in the preview method for previewing any particular frame of the
         animation if the user should want to do so.
 
         Called in:
+            - _frame_blitter
             - preview
-            - animate
+            - saveframe
 
         Calls on:
+            - _marker_values
+            - _marker_vectors
+            - _to_rgba
+            - _rotated_paths
             - _update_markers
         '''
         if not self.director:
-            try:
-                self.cont.remove()
-            except:
-                pass
-
-            try:
-                self.arrows.remove()
-            except:
-                pass
-
-            try:
-                self.CB.remove()
-            except:
-                pass
-
-            GS = mgs.GridSpec(1,1,figure=self.fig)
-            self.ax1.set_subplotspec(GS[0])
-
-            tick_labels = []
-            for m in range(9):
-                n = np.abs(4-m)
-                d = 4
-
-                nr = n/np.gcd(n,d)
-                dr = d/np.gcd(n,d)
-
-                if m < 4:
-                    if nr == 1 and dr == 1:
-                        label = r'$-\pi$'
-                    elif nr == 1:
-                        label = r'$-\frac{\pi}{%d}$' % dr
-                    elif dr == 1:
-                        label = r'$-%d\pi$' % nr
-                    else:
-                        label = r'$-\frac{%d\pi}{%d}$' % (nr,dr)
-                elif m == 4:
-                    label = r'$0$'
-                else:
-                    if nr == 1 and dr == 1:
-                        label = r'$\pi$'
-                    elif nr == 1:
-                        label = r'$\frac{\pi}{%d}$' % dr
-                    elif dr == 1:
-                        label = r'$%d\pi$' % nr
-                    else:
-                        label = r'$\frac{%d\pi}{%d}$' % (nr,dr)
-                tick_labels.append(label)
-
             if self.field_type == 'complex':
-                self.RGBA = self.SM.to_rgba(self.thetas[i,:,:])
-
-                self._vx = self.rs[i,:,:]*np.cos(self.thetas[i,:,:])
-                self._vy = self.rs[i,:,:]*np.sin(self.thetas[i,:,:])
-
                 if self.which == 'pf':
-                    self.RGBA[:,:,-1] = self.rs_norm[i,:,:]
-                    self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
+                    self.RGBA = self._to_rgba(self.thetas[i,:,:],alpha=self.rs_norm[i,:,:])
+                    self.cont.set_array(self.RGBA)
                 elif self.which == 'op':
-                    self.arrow.set_UVC(self._vx[i,::self._slc_y,::self._slc_x],self._vy[i,::self._slc_y,::self._slc_x])
+                    U,V,C = self._marker_vectors(i)
+                    self.arrow.set_UVC(U,V)
                 elif self.which == 'both':
-                    self.RGBA[:,:,-1] = self.pf_transparency
+                    if self.mode != 1:
+                        self.RGBA = self._to_rgba(self.thetas[i,:,:],alpha=self.pf_transparency)
+                    U,V,C = self._marker_vectors(i)
                     if self.mode == 0:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),alpha=self.pf_transparency,zorder=0)
-                        self.arrow.set_UVC(self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x])
+                        self.cont.set_array(self.RGBA)
+                        self.arrow.set_UVC(U,V)
                     elif self.mode == 1:
-                        self.arrow.set_UVC(self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[i,::self._slc_y,::self._slc_x])
+                        self.arrow.set_UVC(U,V,C)
                     elif self.mode == 2:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),alpha=self.pf_transparency,zorder=0)
-                        self.arrow.set_UVC(self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[i,::self._slc_y,::self._slc_x])
-                if self.which != 'op':
-                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.thetas),np.max(self.thetas),9))
-                    self.CB.set_label(r'$\text{arg}\left(\Psi_p\right)$',rotation='vertical',fontsize=self.CB_label_fontsize)
-                    self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
-                    self.CB.ax.set_facecolor(self.ax_fc)
-                    self.CB.set_ticklabels(tick_labels)
+                        self.cont.set_array(self.RGBA)
+                        self.arrow.set_UVC(U,V,C)
             elif self.field_type == 'phase':
-                self.RGBA = self.SM.to_rgba(self.thetas[i,:,:])
-
-                self._vx = np.cos(self.thetas[i,:,:])
-                self._vy = np.sin(self.thetas[i,:,:])
+                self.RGBA = self._to_rgba(self.thetas[i,:,:])
 
                 if self.which == 'pf':
-                    self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
+                    self.cont.set_array(self.RGBA)
                 elif self.which == 'op':
-                    self.arrow.set_UVC(self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x])
+                    U,V,C = self._marker_vectors(i)
+                    self.arrow.set_UVC(U,V)
                 elif self.which == 'both':
+                    U,V,C = self._marker_vectors(i)
                     if self.mode == 0:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
-                        self.arrow.set_UVC(self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x])
+                        self.cont.set_array(self.RGBA)
+                        self.arrow.set_UVC(U,V)
                     elif self.mode == 1:
-                        self.arrow.set_UVC(self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[i,::self._slc_y,::self._slc_x])
+                        self.arrow.set_UVC(U,V,C)
                     elif self.mode == 2:
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.thetas),vmax=np.max(self.thetas),zorder=0)
-                        self.arrow.set_UVC(self._vx[::self._slc_y,::self._slc_x],self._vy[::self._slc_y,::self._slc_x],self.thetas[i,::self._slc_y,::self._slc_x])
-                if self.which != 'op':
-                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.thetas),np.max(self.thetas),9))
-                    self.CB.set_label(r'$\text{arg}\left(\Psi_p\right)$',rotation='vertical',fontsize=self.CB_label_fontsize)
-                    self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
-                    self.CB.ax.set_facecolor(self.ax_fc)
-                    self.CB.set_ticklabels(tick_labels)
+                        self.cont.set_array(self.RGBA)
+                        self.arrow.set_UVC(U,V,C)
             elif self.field_type == 'magnitude':
-                self.RGBA = self.SM.to_rgba(self.rs[i,:,:])
+                self.RGBA = self._to_rgba(self.rs[i,:,:])
 
-                self.cont = self.ax1.pcolormesh(self.x,self.y,self.RGBA,shading='nearest',cmap=self.colormap,vmin=np.min(self.rs),vmax=np.max(self.rs),zorder=0)
-                self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.rs),np.max(self.rs),9))
-                self.CB.set_label(r'$\left|\Psi_p\right|\,\left[\left|\Psi_0\right|\right]$',rotation='vertical',fontsize=self.CB_label_fontsize)
-                self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
-                self.CB.ax.set_facecolor(self.ax_fc)
-
-                ticks = np.linspace(0,1,9)
-                tick_labels = [str(tick) for tick in ticks]
-                self.CB.set_ticklabels(tick_labels)
+                self.cont.set_array(self.RGBA)
         else:
             if self.which == "pf":
-                self.CB.remove()
-                self.cont.remove()
-                self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[i,:,:],shading='nearest',
-                                                cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
-                self.cont.set_clim([np.min(self.field),np.max(self.field)])
+                self.cont.set_array(self.field[i,:,:])
             else:
                 if self.p == 1:
-                    self.arrow.set_UVC(self._vx[i,::self._slc_y,::self._slc_x],self._vy[i,::self._slc_y,::self._slc_x])
+                    U,V,values = self._marker_vectors(i)
+                    self.arrow.set_UVC(U,V)
                 elif self.p > 1:
-                    patch_markers = []
-                    point_markers = []
-                    tick_markers = []
-
-                    for j in range(0,len(self.field[i,:,:]),self._slc_y):
-                        for k in range(0,len(self.field[i,j,:]),self._slc_x):
-                            t = Affine2D().rotate_deg(self.field[i,j,k]*(180/np.pi)-90)
-                            patch_markers.append(mpath.Path.unit_regular_polygon(self.p).transformed(t))
-                            point_markers.append(mpath.Path.unit_regular_asterisk(self.p).transformed(t))
-                            tick_markers.append(mpath.Path.unit_regular_asterisk(1).transformed(t))
+                    values = self._marker_values(self.field,i)
+                    patch_markers = self._rotated_paths("patch",values)
+                    point_markers = self._rotated_paths("point",values)
+                    tick_markers = self._rotated_paths("tick",values)
 
                     self._update_markers(patch_markers,point_markers,tick_markers)
 
                 if self.which == "both" and self.grouping == "together":
                     if self.mode == 0:
-                        self.CB.remove()
-                        self.cont.remove()
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[i,:,:],shading='nearest',
-                                                        cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
-                        self.cont.set_clim([np.min(self.field),np.max(self.field)])
+                        self.cont.set_array(self.field[i,:,:])
                     elif self.mode == 1:
-                        self.CB.remove()
                         if self.p == 1:
-                            self.arrow.set_array(self.field[i,::self._slc_y,::self._slc_x].ravel())
+                            self.arrow.set_array(values)
                         elif self.p == 2:
-                            self.point.set_array(self.field[i,::self._slc_y,::self._slc_x].ravel())
+                            self.point.set_array(values)
                         else:
-                            self.patch.set_array(self.field[i,::self._slc_y,::self._slc_x].ravel())
+                            self.patch.set_array(values)
                     elif self.mode == 2:
-                        self.CB.remove()
-                        self.cont.remove()
-                        self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[i,:,:],shading='nearest',
-                                                        cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
-                        self.cont.set_clim([np.min(self.field),np.max(self.field)])
+                        self.cont.set_array(self.field[i,:,:])
                         if self.p == 1:
-                            self.arrow.set_array(self.field[i,::self._slc_y,::self._slc_x].ravel())
+                            self.arrow.set_array(values)
                         elif self.p == 2:
-                            self.point.set_array(self.field[i,::self._slc_y,::self._slc_x].ravel())
+                            self.point.set_array(values)
                         else:
-                            self.patch.set_array(self.field[i,::self._slc_y,::self._slc_x].ravel())
+                            self.patch.set_array(values)
                 elif self.which == "both" and self.grouping == "separate":
-                    self.CB.remove()
-                    self.cont.remove()
-                    self.cont = self.ax1.pcolormesh(self.x,self.y,self.field[i,:,:],shading='nearest',
-                                                    cmap=self.colormap,alpha=self.pf_transparency,vmin=np.min(self.field),vmax=np.max(self.field),zorder=0)
-                    self.cont.set_clim([np.min(self.field),np.max(self.field)])
-
-            if self.which != 'op':
-                if self.grouping == 'together' and self.mode == 1:
-                    self.SM.set_clim([np.min(self.field),np.max(self.field)])
-                    self.CB = self.fig.colorbar(self.SM,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.field),np.max(self.field),9))
-                else:
-                    self.cont.set_clim([np.min(self.field),np.max(self.field)])
-                    self.CB = self.fig.colorbar(self.cont,ax=self.ax1,fraction=0.07,pad=0.0175,ticks=np.linspace(np.min(self.field),np.max(self.field),9))
-                self.CB.ax.set_facecolor(self.ax_fc)
-                self.CB.set_label(r'$\text{arg}\left(\mathbf{n}^{(%d)}\right)$' % self.p,rotation='vertical',fontsize=self.CB_label_fontsize)
-                self.CB.ax.tick_params(labelsize=self.CB_tick_fontsize)
-
-                tick_labels = []
-                for m in range(9):
-                    n = np.abs(4-m)
-                    d = 4*self.p
-
-                    nr = n/np.gcd(n,d)
-                    dr = d/np.gcd(n,d)
-
-                    if m < 4:
-                        if nr == 1 and dr == 1:
-                            label = r'$-\pi$'
-                        elif nr == 1:
-                            label = r'$-\frac{\pi}{%d}$' % dr
-                        elif dr == 1:
-                            label = r'$-%d\pi$' % nr
-                        else:
-                            label = r'$-\frac{%d\pi}{%d}$' % (nr,dr)
-                    elif m == 4:
-                        label = r'$0$'
-                    else:
-                        if nr == 1 and dr == 1:
-                            label = r'$\pi$'
-                        elif nr == 1:
-                            label = r'$\frac{\pi}{%d}$' % dr
-                        elif dr == 1:
-                            label = r'$%d\pi$' % nr
-                        else:
-                            label = r'$\frac{%d\pi}{%d}$' % (nr,dr)
-                    tick_labels.append(label)
+                    self.cont.set_array(self.field[i,:,:])
 
-                self.CB.set_ticklabels(tick_labels)
-        
         if self.timestamp:
             if self.ts is not None:
                 self.ts_text.set_text(r'$t/\tau=%.2f$' % self.ts[i])
             else:
                 self.ts_text.remove()
 
+    def _blit_artists(self):
+        '''
+        Internal method for collecting the artists that have to be redrawn in every frame when the
+        animation is blitted. Besides the artists updated in _draw_frame, these include all the
+        artists stacked above them, so that the drawing order of every axes is preserved. The
+        artists are returned in drawing order. The colorbar and the layout of the figure are the
+        same for every frame in all of the plotting configurations, so every animation is blitted.
+
+        Called in:
+            - _start_blit
+
+        Calls on:
+            - None
+        '''
+        updated = []
+        if not self.director:
+            if self.field_type == 'magnitude' or self.which == 'pf':
+                updated.append(self.cont)
+            else:
+                updated.append(self.arrow)
+
+                if self.which == 'both' and self.mode != 1:
+                    updated.append(self.cont)
+        elif self.which == "pf":
+            updated.append(self.cont)
+        else:
+            if self.p == 1:
+                updated.append(self.arrow)
+            else:
+                updated.extend([self.patch,self.point,self.tick])
+
+            if self.which == "both" and (self.grouping == "separate" or self.mode != 1):
+                updated.append(self.cont)
+        if self.timestamp:
+            updated.append(self.ts_text)
+
+        artists = []
+        for ax in self.fig.axes:
+            zorders = [artist.get_zorder() for artist in updated if artist.axes is ax]
+            if zorders:
+                children = [child for child in ax.get_children() if child is not ax.patch and child.get_zorder() >= min(zorders)]
+                if not (ax.axison and ax.get_frame_on()):
+                    children = [child for child in children if child not in ax.spines.values()]
+                if not ax.axison:
+                    children = [child for child in children if child not in (ax.xaxis,ax.yaxis)]
+                artists.extend(sorted(children,key=lambda child: child.get_zorder()))
+
+        return artists
+
     def set_grid(self,c,which='both'):
         '''
         Sets up the coordinate grid(s) for the plot. If this method is called before the user
@@ -1477,27 +2147,25 @@ class PAticAnimator(object):
                    'y' - sets the y-coordinate grid,
                 'both' - sets the same coordinate grid for both the x- and y-axes.
         '''
-        if which.lower() not in ["x","y","both"]:
+        which = which.lower()
+        if which not in ["x","y","both"]:
             raise ValueError("""which must be either 'x', 'y' or 'both'.""")
         else:
-            self._check_coordinate(c)
+            lo,hi = self._check_coordinate(c)
             if which == "x":
-                self.x0 = np.min(c)
-                self.x1 = np.max(c)
+                self.x0,self.x1 = lo,hi
                 if self.field is not None:
-                    self._set_grid_from_coordinate([self.x0,self.x1],which='x')
+                    self._set_x_grid()
             elif which == "y":
-                self.y0 = np.min(c)
-                self.y1 = np.max(c)
+                self.y0,self.y1 = lo,hi
                 if self.field is not None:
-                    self._set_grid_from_coordinate([self.y0,self.y1],which='y')
+                    self._set_y_grid()
             elif which == "both":
-                self.x0 = np.min(c)
-                self.x1 = np.max(c)
-                self.y0 = np.min(c)
-                self.y1 = np.max(c)
+                self.x0,self.x1 = lo,hi
+                self.y0,self.y1 = self.x0,self.x1
                 if self.field is not None:
-                    self._set_grid_from_coordinate(c,which='both')
+                    self._set_x_grid()
+                    self._set_y_grid()
 
     def set_phi(self,data):
         '''
@@ -1510,20 +2178,22 @@ class PAticAnimator(object):
         one. In that case, the new phase field array doesn't need to be of the exact same shape as
         the old one (although its shape must still be of the form (nt,ny,nx)). The coordinate grids
         will automatically be adjusted to match the shape of the phase field array along the last
-        two axes.
+        two axes. If the new array has the same number of grid points as the old one, the existing
+        grid is kept as it is. Either way, the marker size is reset to the automatic value.
 
         Positional arguments:
             data: array
                 The phase field data must be given as a 3D array with shape (nt,ny,nx).
         '''
-        self._check_phi(data)
+        data = self._check_phi(data)
+        same_shape = self.field is not None and self.field.shape[1:] == data.shape[1:]
         self.field = data
+        self._decompose_field()
         self.nx = data.shape[2]
         self.ny = data.shape[1]
         self.nt = data.shape[0]
 
-        self._slc_x = self.nx//int(self.marker_density_x*self.nx)
-        self._slc_y = self.ny//int(self.marker_density_y*self.ny)
+        self._set_marker_slices()
 
         if self.x is None and self.y is None:
             if self.x0 is None and self.x1 is None and self.y0 is None and self.y1 is None:
@@ -1531,27 +2201,28 @@ class PAticAnimator(object):
 
                 self._set_marker_size()
             elif self.x0 is not None and self.x1 is not None and self.y0 is None and self.y1 is None:
-                self._set_grid_from_coordinate([self.x0,self.x1],which='x')
+                self._set_x_grid()
             elif self.x0 is None and self.x1 is None and self.y0 is not None and self.y1 is not None:
-                self._set_grid_from_coordinate([self.y0,self.y1],which='y')
+                self._set_y_grid()
             elif self.x0 is not None and self.x1 is not None and self.y0 is not None and self.y1 is not None:
-                self._set_grid_from_coordinate([self.x0,self.x1],which='x')
-                self._set_grid_from_coordinate([self.y0,self.y1],which='y')
+                self._set_x_grid()
+                self._set_y_grid()
 
                 self._set_marker_size()
         elif self.x is not None and self.y is None:
             if self.y0 is not None and self.y1 is not None:
-                self._set_grid_from_coordinate([self.y0,self.y1],which='y')
+                self._set_y_grid()
 
                 self._set_marker_size()
         elif self.x is None and self.y is not None:
             if self.x0 is not None and self.x1 is not None:
-                self._set_grid_from_coordinate([self.x0,self.x1],which='x')
+                self._set_x_grid()
 
                 self._set_marker_size()
         elif self.x is not None and self.y is not None:
-            self._set_grid_from_coordinate([self.x0,self.x1],which='x')
-            self._set_grid_from_coordinate([self.y0,self.y1],which='y')
+            if not same_shape:
+                self._set_x_grid()
+                self._set_y_grid()
 
             self._set_marker_size()
 
@@ -1567,24 +2238,19 @@ class PAticAnimator(object):
                   'op' - order parameter,
                 'both' - phase field and order parameter.
         '''
-        if which.lower() not in self._which_list:
-            msg = """which must be one of """ + "'%s', "*(len(self._which_list)-1) + "and '%s'."
-            raise ValueError(msg % tuple(self._which_list))
+        which = which.lower()
+        if which not in self._which_set:
+            raise ValueError(self._which_msg)
 
-        try:
-            self.ax2.remove()
-            self.ax1.remove()
-            self.fig.set_figheight(10.0)
-            self.fig.set_figwidth(10.0)
-            self.ax1 = self.fig.add_subplot(111,facecolor='whitesmoke')
-            self.grouping = "together"
-        except:
-            pass
+        if which != self.which:
+            if self.which == "both" and self.grouping == "separate" and self.field_type != 'complex':
+                self.grouping = "together"
+            self._axes_dirty = self.fig is not None
 
         if self.which == "pf":
             self.pf_transparency = 1.0
 
-        self.which = which.lower()
+        self.which = which
 
     def set_grouping(self,grouping):
         '''
@@ -1601,38 +2267,28 @@ class PAticAnimator(object):
                 'together' - plot the phase field and order parameter in the same coordinate
                              system.
         '''
-        if grouping.lower() not in self._grouping_list:
-            msg = """grouping must be one of """ + "'%s', "*(len(self._grouping_list)-1) + "and '%s'."
-            raise ValueError(msg % self._grouping_list)
+        grouping = grouping.lower()
+        if grouping not in self._grouping_set:
+            raise ValueError(self._grouping_msg)
+
+        if grouping != self.grouping:
+            self._axes_dirty = self.fig is not None
 
         if self.field_type != 'complex':
             if self.which == "both":
-                if self.grouping != grouping.lower() and grouping.lower() == "separate":
-                    self.ax1.remove()
-                    self.fig.set_figwidth(24.0)
-                    self.fig.set_figheight(10.0)
-                    self.ax1 = self.fig.add_subplot(121,facecolor=self.ax_fc)
-                    self.ax2 = self.fig.add_subplot(122,facecolor='whitesmoke')
-                elif self.grouping != grouping.lower() and grouping.lower() == "together":
-                    self.ax1.remove()
-                    self.ax2.remove()
-                    self.fig.set_figwidth(12.0)
-                    self.fig.set_figheight(10.0)
-                    self.ax1 = self.fig.add_subplot(111,facecolor=self.ax_fc)
-
-                if grouping.lower() == "together" and (self.mode == 1 or self.mode == 2):
+                if grouping == "together" and (self.mode == 1 or self.mode == 2):
                     if self.p == 2:
                         self.marker_type = "point"
                     else:
                         self.marker_type = "patch"
                         self.marker_transparencies["patch"] = 1.0
                     self.pf_transparency = 0.25
-                elif grouping.lower() == "separate":
+                elif grouping == "separate":
                     self.marker_type = "all"
                     self.marker_transparencies["patch"] = 0.5
                     self.pf_transparency = 1.0
 
-        self.grouping = grouping.lower()
+        self.grouping = grouping
 
     def set_mode(self,mode):
         '''
@@ -1662,8 +2318,7 @@ class PAticAnimator(object):
                     marker over semi-transparent phase field.
         '''
         if mode not in self._mode_list:
-            msg = """The allowed values for the mode keyword argument are """ + "%s, "*(len(self._mode_list)-1) + "and %s."
-            raise ValueError(msg % self._mode_list)
+            raise ValueError(self._mode_msg)
 
         self.mode = mode
 
@@ -1683,8 +2338,9 @@ class PAticAnimator(object):
     def set_marker_density(self,density,direction='both'):
         '''
         Sets the density of markers along either x- or y-axis, or both simultaneously. If called
-        without a defined coordinate grid in the specified direction, then the method will have
-        no effect.
+        without a defined coordinate grid in the specified direction, or with the density that is
+        already set, then the method will have no effect. Otherwise the marker size is reset to the
+        automatic value for the new density.
 
         Positional arguments:
             density: int, float || (0,1]
@@ -1702,40 +2358,42 @@ class PAticAnimator(object):
         if direction not in ["x","y","both"]:
             raise ValueError("""direction must be 'x', 'y' or 'both'.""")
 
-        try:
-            density = float(density)
-        except:
-            raise TypeError("""density must be a number in the half-open interval (0,1].""")
+        density = self._as_float(density,"""density must be a number in the half-open interval (0,1].""")
+        if density <= 0:
+            raise ValueError("""density must be greater than 0.""")
 
-        if density < 0:
-            raise ValueError("""density cannot be less than 0.""")
-        elif density > 1:
-            density = 1            
+        density = min(1.0,density)
+
+        if direction == "x" and density == self.marker_density_x:
+            return
+        elif direction == "y" and density == self.marker_density_y:
+            return
+        elif direction == "both" and density == self.marker_density_x and density == self.marker_density_y:
+            return
 
         if direction == "x":
             if self.x is not None:
                 self.marker_density_x = density
-                self._slc_x = self.nx//int(self.marker_density_x*self.nx)
+                self._set_marker_slices()
                 if self.x is not None and self.y is not None:
                     self._set_marker_size()
         elif direction == "y":
             if self.y is not None:
                 self.marker_density_y = density
-                self._slc_y = self.ny//int(self.marker_density_y*self.ny)
+                self._set_marker_slices()
                 if self.x is not None and self.y is not None:
                     self._set_marker_size()
         elif direction == "both":
             if self.x is not None and self.y is None:
                 self.marker_density_x = density
-                self._slc_x = self.nx//int(self.marker_density_x*self.nx)
+                self._set_marker_slices()
             elif self.x is None and self.y is not None:
                 self.marker_density_y = density
-                self._slc_y = self.ny//int(self.marker_density_y*self.ny)
+                self._set_marker_slices()
             elif self.x is not None and self.y is not None:
                 self.marker_density_x = density
                 self.marker_density_y = density
-                self._slc_x = self.nx//int(self.marker_density_x*self.nx)
-                self._slc_y = self.ny//int(self.marker_density_y*self.ny)
+                self._set_marker_slices()
 
                 self._set_marker_size()
 
@@ -1778,12 +2436,11 @@ class PAticAnimator(object):
                   other - all the other allowed values for the marker_type set any combination of
                           the three basic marker sub-types.
         '''
-        if marker_type.lower() not in self._marker_types:
-            msg = """The possible marker types are """ + "'%s', "*(len(self._marker_types)-1) + "and '%s'."
-            f = tuple([marker_type for marker_type in self._marker_types])
-            raise ValueError(msg % f)
+        marker_type = marker_type.lower()
+        if marker_type not in self._marker_type_set:
+            raise ValueError(self._marker_type_msg)
 
-        self.marker_type = marker_type.lower()
+        self.marker_type = marker_type
 
     def set_marker_color(self,color,which='patch'):
         '''
@@ -1800,7 +2457,8 @@ class PAticAnimator(object):
             which: str || 'patch' | 'point' | 'tick' | (default: 'patch')
                 Determines which of the marker sub-types the color should apply to.
         '''
-        if which.lower() not in ["patch","point","tick"]:
+        which = which.lower()
+        if which not in self._marker_subtypes:
             raise ValueError("""The which keyword argument can be one of 'patch', 'point' or 'tick'.""")
 
         self.marker_colors[which] = color
@@ -1817,14 +2475,10 @@ class PAticAnimator(object):
             size: float, int
                 Sets the marker size.
         '''
-        if (isinstance(size,int) or isinstance(size,float)) and size < 0:
+        size = self._as_float(size,"""size must be a number.""")
+        if size < 0:
             raise ValueError("""size cannot be negative.""")
 
-        try:
-            size = float(size)
-        except:
-            raise TypeError("""size must be a number.""")
-
         self.marker_size = size
 
     def set_marker_linewidth(self,linewidth,which='point'):
@@ -1841,15 +2495,13 @@ class PAticAnimator(object):
             which: str || 'patch' | 'point' | 'tick' | (default: 'point')
                 Determines which of the basic marker sub-types the linewidth should apply to.
         '''
-        if which.lower() not in ["patch","point","tick"]:
+        which = which.lower()
+        if which not in self._marker_subtypes:
             raise ValueError("""The which keyword argument can be one of 'patch', 'point' or 'tick'.""")
 
-        if (isinstance(linewidth,int) or isinstance(linewidth,float)) and linewidth < 0:
+        linewidth = self._as_float(linewidth,"""The linewidth must be a number.""")
+        if linewidth < 0:
             raise ValueError("""linewidth cannot be negative.""")
-        try:
-            linewidth = float(linewidth)
-        except:
-            raise TypeError("""The linewidth must be a number.""")
 
         self.marker_linewidths[which] = linewidth
 
@@ -1870,20 +2522,11 @@ class PAticAnimator(object):
             which: 'patch' | 'point' | 'tick' | (default: 'patch')
                 Determines which of the marker sub-types the transparency should apply to.
         '''
-        if which.lower() not in ["patch","point","tick"]:
+        which = which.lower()
+        if which not in self._marker_subtypes:
             raise ValueError("""The which keyword argument must be one of 'patch', 'point' or 'tick'.""")
 
-        try:
-            alpha = float(alpha)
-        except:
-            raise TypeError("""alpha must be a number between 0 and 1.""")
-
-        if alpha > 1:
-            self.marker_transparencies[which] = 1
-        elif alpha < 0:
-            self.marker_transparencies[which] = 0
-        else:
-            self.marker_transparencies[which] = alpha
+        self.marker_transparencies[which] = self._as_fraction(alpha,"""alpha must be a number between 0 and 1.""")
 
     def set_axes_facecolor(self,color):
         if not isinstance(color,str):
@@ -1916,17 +2559,7 @@ class PAticAnimator(object):
                 Transparency value. Because the transparency must be a number in the interval
                 [0,1], if alpha is greater than 1, the phase field transparency will be set to 1.
         '''
-        try:
-            alpha = float(alpha)
-        except:
-            raise TypeError("""alpha must be a number between 0 and 1.""")
-
-        if alpha > 1:
-            self.pf_transparency = 1
-        elif alpha < 0:
-            self.pf_transparency = 0
-        else:
-            self.pf_transparency = alpha
+        self.pf_transparency = self._as_fraction(alpha,"""alpha must be a number between 0 and 1.""")
 
     def set_timestamp_props(self,prop,which=None):
         if which == 'fontsize':
@@ -1955,7 +2588,7 @@ class PAticAnimator(object):
             if frame is not None:
                 if not isinstance(frame,int):
                     raise TypeError("""frame must be an integer.""")
-                elif isinstance(frame,int) and frame >= self.nt:
+                elif frame >= self.nt:
                     frame = self.nt - 1
                 self._draw_frame(frame)
             else:
@@ -1971,45 +2604,64 @@ class PAticAnimator(object):
             if frame is not None:
                 if not isinstance(frame,int):
                     raise TypeError("""frame must be an integer.""")
-                elif isinstance(frame,int) and frame >= self.nt:
+                elif frame >= self.nt:
                     frame = self.nt - 1
                 self._draw_frame(frame)
             else:
                 self._draw_frame(0)
         plt.savefig('./frame_%d.png' % frame)
 
-    def animate(self,ext='gif'):
+    def animate(self,ext='gif',workers=1):
         '''
         Makes the animation of the phase field/ order parameter time evolution and saves it to the
         same location as the script from which the method is called.
 
+        The frames are rendered straight from the canvas into the video encoder, without being saved
+        as images first. By default they are rendered in the calling process. With more than one
+        worker, they are split into contiguous chunks, which are rendered by a pool of worker
+        processes. Every worker receives a copy of the animator object once, with the phase field
+        and the arrays derived from it read from shared memory, and builds its own figure once for
+        all of the chunks it renders. The chunks hold at most two frames each, and only twice as
+        many chunks as there are workers are rendered ahead of the encoder, so the memory used for
+        the frames doesn't grow with their number. On platforms on which the worker processes are
+        spawned rather than forked (e.g. Windows and macOS), the calling script must guard its entry
+        point with if __name__ == '__main__'.
+
         Keyword arguments:
             ext: str || 'gif' | 'mp4 | (default: 'gif')
                 Sets the output file type for the animation.
-        '''
-
-        if ext.lower() not in ['gif','mp4']:
-            raise ValueError("""The ext keyword argment must be either 'gif' or 'mp4'.""")
 
-        self._initialize_plot()
-
-        folder_name = '_%s_frames' % datetime.datetime.now().strftime('%y%m%d_%H%M%S')
-        os.mkdir('./' + folder_name)
-        for i in range(self.nt):
-            self._draw_frame(i)
-            plt.savefig('./' + folder_name + '/frame_%d.png' % i)
-
-        ims = []
-        for i in range(self.nt):
-            ims.append(iio.imread('./' + folder_name + '/frame_%d.png' % i))
-        frames = np.stack(ims,axis=0)
+            workers: int, None || (default: 1)
+                Number of processes among which the frames are rendered. If workers is 1, the frames
+                are rendered in the calling process. If workers is None, it will be set to the
+                number of CPUs.
+        '''
 
-        dim = (int(self.fig.get_figwidth()*self.fig.get_dpi()),int(self.fig.get_figheight()*self.fig.get_dpi()))
+        if self.field is None:
+            raise Exception("""No data to display.""")
 
-        gen = imageio.plugins.ffmpeg.imageio_ffmpeg.write_frames('PAA_%s.%s' % (datetime.datetime.now().strftime('%y%m%d_%H%M%S'),ext.lower()),dim,fps=60,pix_fmt_in='rgba')
-        gen.send(None)
-        for frame in frames:
-            gen.send(frame)
-        gen.close()
+        ext = ext.lower()
+        if ext not in ['gif','mp4']:
+            raise ValueError("""The ext keyword argment must be either 'gif' or 'mp4'.""")
 
-        shutil.rmtree('./' + folder_name)
\ No newline at end of file
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif not isinstance(workers,int):
+            raise TypeError("""workers must be an integer.""")
+        elif workers < 1:
+            raise ValueError("""workers must be greater than or equal to 1.""")
+        workers = min(workers,self.nt)
+
+        file_name = 'PAA_%s.%s' % (datetime.datetime.now().strftime('%y%m%d_%H%M%S'),ext)
+        if workers == 1:
+            _write_frames(file_name,_iter_frames(self,range(self.nt)),ext)
+        else:
+            light,specs,blocks = _share_arrays(self)
+            try:
+                chunks = np.array_split(np.arange(self.nt),max(min(self.nt,4*workers),-(-self.nt//2)))
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers,initializer=_init_render_worker,initargs=(light,specs)) as executor:
+                    _write_frames(file_name,_iter_rendered_frames(executor,chunks,2*workers),ext)
+            finally:
+                for shm in blocks:
+                    shm.close()
+                    shm.unlink()
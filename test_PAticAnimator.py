@@ -0,0 +1,194 @@
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import matplotlib.pyplot as plt
+import pytest
+
+import glob
+import os
+import subprocess
+import sys
+
+import imageio.v3 as iio
+
+from PAticAnimator import PAticAnimator,_decompose_complex,_gather_marker_values,_rotate_vertices
+
+@pytest.mark.parametrize("field_type",["complex","phase","magnitude"])
+def test_nan_is_drawn_with_bad_color(field_type):
+    rng = np.random.default_rng(0)
+    field = rng.uniform(0.5,1.0,(2,30,40))*np.exp(1j*rng.uniform(-np.pi,np.pi,(2,30,40)))
+    field[0,5,7] = np.nan
+    if field_type == "phase":
+        field = np.angle(field)
+    elif field_type == "magnitude":
+        field = np.abs(field)
+
+    animator = PAticAnimator(2,field,field_type=field_type)
+    animator._initialize_plot()
+    animator._draw_frame(0)
+
+    bad = np.array(animator.SM.cmap(np.nan,bytes=True))
+    assert (animator.RGBA[5,7,:3] == bad[:3]).all()
+
+    if field_type == "magnitude":
+        values = animator.rs[0]
+    else:
+        values = animator.thetas[0]
+
+    finite = np.isfinite(values)
+    finite[5,7] = False
+    expected = animator.SM.to_rgba(values,bytes=True)
+    assert np.abs(animator.RGBA[...,:3].astype(int) - expected[...,:3])[finite].max() <= 1
+
+    plt.close(animator.fig)
+
+@pytest.mark.parametrize("magnitude",[True,False])
+def test_decompose_complex(magnitude):
+    rng = np.random.default_rng(1)
+    field = rng.normal(size=(3,20,30)) + 1j*rng.normal(size=(3,20,30))
+
+    thetas,rs,extrema = _decompose_complex(field,magnitude)
+
+    np.testing.assert_allclose(thetas,np.angle(field))
+    if magnitude:
+        np.testing.assert_allclose(rs,np.abs(field))
+        np.testing.assert_allclose(extrema,[thetas.min(),thetas.max(),rs.min(),rs.max()])
+    else:
+        assert rs is None
+        np.testing.assert_allclose(extrema[:2],[thetas.min(),thetas.max()])
+
+@pytest.mark.parametrize("magnitude",[True,False])
+@pytest.mark.parametrize("nan_at",[0,17,-1])
+def test_decompose_complex_skips_nan(magnitude,nan_at):
+    rng = np.random.default_rng(3)
+    field = rng.normal(size=(3,20,30)) + 1j*rng.normal(size=(3,20,30))
+    field.reshape(-1)[nan_at] = np.nan
+
+    thetas,rs,extrema = _decompose_complex(field,magnitude)
+
+    assert np.isnan(thetas.reshape(-1)[nan_at])
+    angles = np.angle(field)
+    expected = [np.nanmin(angles),np.nanmax(angles)]
+    if magnitude:
+        expected += [np.nanmin(np.abs(field)),np.nanmax(np.abs(field))]
+    np.testing.assert_allclose(extrema[:len(expected)],expected)
+
+def test_marker_helpers():
+    rng = np.random.default_rng(2)
+    a = rng.normal(size=500)
+    idx = rng.integers(0,a.size,40)
+    out = np.empty(idx.size)
+
+    assert _gather_marker_values(a,idx,out) is out
+    np.testing.assert_array_equal(out,a[idx])
+
+    angles = rng.uniform(-np.pi,np.pi,7)
+    vertices = rng.normal(size=(5,2))
+    rotated = _rotate_vertices(angles,vertices)
+
+    c,s = np.cos(angles)[:,None],np.sin(angles)[:,None]
+    np.testing.assert_allclose(rotated[...,0],c*vertices[:,0] - s*vertices[:,1])
+    np.testing.assert_allclose(rotated[...,1],s*vertices[:,0] + c*vertices[:,1])
+
+@pytest.mark.parametrize("ext",["gif","mp4"])
+def test_animate_exits(ext,tmp_path):
+    script = (
+        "import matplotlib; matplotlib.use('Agg')\n"
+        "import numpy as np\n"
+        "from PAticAnimator import PAticAnimator\n"
+        "rng = np.random.default_rng(4)\n"
+        "field = np.exp(1j*rng.uniform(-np.pi,np.pi,(3,20,30)))\n"
+        "PAticAnimator(2,field).animate(ext=%r)\n" % ext
+    )
+    path = [os.path.dirname(os.path.abspath(__file__))] + os.environ.get('PYTHONPATH','').split(os.pathsep)
+    env = dict(os.environ,PYTHONPATH=os.pathsep.join(filter(None,path)))
+    subprocess.run([sys.executable,'-c',script],cwd=tmp_path,env=env,check=True,timeout=120)
+
+    assert len(list(tmp_path.glob('PAA_*.%s' % ext))) == 1
+
+def test_animate_workers_match_serial(tmp_path,monkeypatch):
+    rng = np.random.default_rng(5)
+    field = rng.uniform(0.5,1.0,(9,20,30))*np.exp(1j*rng.uniform(-np.pi,np.pi,(9,20,30)))
+    shm_before = set(glob.glob('/dev/shm/psm_*'))
+
+    files = {}
+    for workers in [1,2]:
+        out_dir = tmp_path/str(workers)
+        out_dir.mkdir()
+        monkeypatch.chdir(out_dir)
+        PAticAnimator(2,field).animate(workers=workers)
+        plt.close('all')
+        files[workers], = out_dir.glob('PAA_*.gif')
+
+    n = 0
+    for serial,pooled in zip(iio.imiter(files[1]),iio.imiter(files[2]),strict=True):
+        np.testing.assert_array_equal(serial,pooled)
+        n += 1
+    assert n == field.shape[0]
+
+    assert set(glob.glob('/dev/shm/psm_*')) <= shm_before
+
+def test_set_phi_resets_marker_size():
+    rng = np.random.default_rng(6)
+    field = rng.normal(size=(2,30,40)) + 1j*rng.normal(size=(2,30,40))
+    animator = PAticAnimator(3,field)
+    default_size = animator.marker_size
+    x,y = animator.x,animator.y
+
+    animator.set_marker_size(7)
+    animator.set_phi(2*field)
+    assert animator.marker_size == default_size
+    assert animator.x is x and animator.y is y
+
+    animator.set_marker_size(7)
+    field = rng.normal(size=(2,300,400)) + 1j*rng.normal(size=(2,300,400))
+    animator.set_phi(field)
+    assert animator.marker_size == animator._marker_sizes_polygon[3]
+    assert animator.x.shape == (1,400) and animator.y.shape == (300,1)
+
+def test_set_marker_density_resets_marker_size_only_on_change():
+    rng = np.random.default_rng(7)
+    field = rng.normal(size=(2,300,400)) + 1j*rng.normal(size=(2,300,400))
+    animator = PAticAnimator(3,field)
+    density = animator.marker_density_x
+
+    animator.set_marker_size(7)
+    animator.set_marker_density(density)
+    assert animator.marker_size == 7
+
+    animator.set_marker_density(0.05)
+    assert animator.marker_size == animator._marker_sizes_polygon[1]
+
+def _ladder_marker_size(p,N):
+    # Values of the range-check ladder that _set_marker_size used before the table lookup:
+    # (marker size, point/tick linewidth), the linewidth being None for p >= 3.
+    if N < 20:
+        size,lw = (140,1.75)
+    elif N < 30:
+        size,lw = (100,1.0) if p >= 3 else (140,1.0)
+    elif N < 40:
+        size,lw = (60,0.85)
+    elif N < 50:
+        size,lw = (30,0.85) if p >= 3 else (45,0.85)
+    else:
+        size,lw = (20,0.85) if p >= 3 else (30,0.85)
+
+    return size,(None if p >= 3 else lw)
+
+@pytest.mark.parametrize("p",[1,2,3,5])
+@pytest.mark.parametrize("N",range(120))
+def test_set_marker_size_matches_ladder(p,N):
+    animator = PAticAnimator(p)
+    size,lw = _ladder_marker_size(p,N)
+
+    for nx,ny in [(N,0),(0,N)]:
+        animator.nx,animator.ny = nx,ny
+        animator.marker_density_x = animator.marker_density_y = 1.0
+        animator.marker_linewidths["point"] = animator.marker_linewidths["tick"] = None
+        animator._set_marker_size()
+
+        assert animator.marker_size == size
+        assert animator.marker_linewidths["point"] == lw
+        assert animator.marker_linewidths["tick"] == lw
+